@@ -2,7 +2,8 @@
 """
 Benchmark lock generator difficulty levels
 
-Usage: python benchmark.py [--vars N] [--trials T]
+Usage: python benchmark.py [--vars N] [--trials T] [--workers W] [--cube K] [--adaptive]
+                           [--seed S] [--backend NAME]
 
 This runs multiple trials at each difficulty level and reports:
 - SAT rate
@@ -18,12 +19,25 @@ Requirements:
 import sys
 import os
 import argparse
+import hashlib
+import inspect
+import io
 import time
-import statistics
+import math
+import pickle
+import random
+import functools
+import itertools
+from collections import namedtuple
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait, as_completed
+from multiprocessing import Pool
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+import lock_generator
+import lock_types
 from lock_generator import (
     generate_trivial_instance,
     generate_easy_instance,
@@ -31,87 +45,499 @@ from lock_generator import (
     generate_hard_instance,
     generate_phase_transition_instance
 )
-from lock_solver import solve_lock
+from lock_solver import (
+    solve_lock, IncrementalLockSolver, new_sat_solver, SolveStats, SAT_BACKENDS, DEFAULT_BACKEND
+)
+from lock_types import LockSolution, DATACLASS_OPTIONS
 
 
-def benchmark_difficulty(name, generator_func, num_vars, num_trials):
-    """Benchmark a single difficulty level"""
-    print(f"\n{'='*60}")
-    print(f"Benchmarking: {name}")
-    print(f"Variables: {num_vars}, Trials: {num_trials}")
-    print(f"{'='*60}")
+# Per-trial record returned by _run_trial (a tuple, so no per-trial dict)
+Trial = namedtuple('Trial', [
+    'trial', 'base_vars', 'total_dials', 'clauses', 'negations',
+    'ratio_base', 'ratio_total', 'time', 'sat'
+])
+
+
+def _solve_cube(clauses, backend=None):
+    """Solve one cube's sub-CNF (runs in a worker process); returns the model or None"""
+    with new_sat_solver(backend or DEFAULT_BACKEND) as solver:
+        solver.append_formula(clauses)
+        if solver.solve():
+            return solver.get_model()
+    return None
+
+
+def _apply_cube(clauses, cube):
+    """
+    Simplify a CNF under a partial assignment.
+
+    Satisfied clauses are dropped, falsified literals are removed, and the
+    cube itself is appended as unit clauses. Returns None if some clause
+    becomes empty (the cube is refuted without calling a solver).
+    """
+    true_lits = set(cube)
+    simplified = []
+    for clause in clauses:
+        if any(lit in true_lits for lit in clause):
+            continue
+        reduced = [lit for lit in clause if -lit not in true_lits]
+        if not reduced:
+            return None
+        simplified.append(reduced)
+    simplified.extend([lit] for lit in cube)
+    return simplified
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class CubeSolveStats(SolveStats):
+    """SolveStats of a solve_lock_parallel call, plus the number of cubes solved"""
+    cubes: int = 0
+
+
+def solve_lock_parallel(instance, k=3, executor=None, backend=None):
+    """
+    Solve a lock instance with cube-and-conquer.
+
+    The first k dial variables are split into 2^k cubes, each cube's
+    simplified CNF is solved in a separate process, and the first SAT
+    answer wins. Returns (LockSolution or None, CubeSolveStats) like
+    solve_lock.
+    """
+    is_valid, error = instance.validate()
+    if not is_valid:
+        raise ValueError(f"Invalid lock instance: {error}")
+
+    clauses = instance.to_cnf()
+
+    stats = CubeSolveStats(num_variables=instance.num_dials, num_clauses=len(clauses))
+
+    k = max(0, min(k, instance.num_dials))
+    cubes = []
+    for signs in itertools.product((1, -1), repeat=k):
+        cube = [sign * dial for sign, dial in zip(signs, range(1, k + 1))]
+        sub_cnf = _apply_cube(clauses, cube)
+        if sub_cnf is not None:
+            cubes.append(sub_cnf)
+    stats.cubes = len(cubes)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor()
+
+    start_time = time.perf_counter()
+    model = None
+    try:
+        pending = {executor.submit(_solve_cube, sub_cnf, backend) for sub_cnf in cubes}
+        while pending and model is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.result() is not None:
+                    model = future.result()
+                    break
+        stats.solve_time = time.perf_counter() - start_time
+
+        # cancel() only drops cubes that have not started; wait for the
+        # running ones outside the timed window, so the next solve on a
+        # shared executor does not queue behind them
+        for future in pending:
+            future.cancel()
+        wait(pending)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=False)
+
+    if model is None:
+        return None, stats
+
+    stats.satisfiable = True
+    true_vars = {lit for lit in model if lit > 0}
+    dial_values = {
+        dial: 6 if dial in true_vars else 1
+        for dial in range(1, instance.num_dials + 1)
+    }
+    return LockSolution(dial_values=dial_values), stats
+
+
+# SAT solver kept alive across the trials run by this process (--reuse-solver)
+_shared_solver = None
+
+
+def _solve_with_shared_solver(instance, backend=None):
+    """Solve an instance on this process's long-lived incremental solver"""
+    global _shared_solver
+    if _shared_solver is None:
+        _shared_solver = IncrementalLockSolver(backend or DEFAULT_BACKEND)
+    return solve_lock(instance, solver=_shared_solver, validated=True)
+
+
+# On-disk cache of generated instances (--cache)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pnp_bench')
+
+
+@functools.lru_cache(maxsize=None)
+def _generator_fingerprint():
+    """Digest of the generator code, so a changed generator misses the cache"""
+    source = inspect.getsource(lock_generator) + inspect.getsource(lock_types)
+    return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+
+def _trial_rng(seed, generator_name, num_vars, trial_idx):
+    """The Random a trial's instance is generated from"""
+    return random.Random(f"{seed}:{generator_name}:{num_vars}:{trial_idx}")
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_generate(generator_name, num_vars, seed, trial_idx):
+    """
+    Generate a trial's instance, reusing earlier runs.
+
+    The instance is the one an uncached run with the same seed generates;
+    it is pickled under CACHE_DIR and reloaded on later runs. The file name
+    includes the run seed and a fingerprint of the generator code, so
+    other seeds and changed generators never read a stale instance.
+    """
+    path = os.path.join(CACHE_DIR, f"{generator_name}_{num_vars}_{seed}_{trial_idx}_"
+                                   f"{_generator_fingerprint()}.pkl")
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    rng = _trial_rng(seed, generator_name, num_vars, trial_idx)
+    instance = getattr(lock_generator, generator_name)(num_vars, rng=rng)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(instance, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return instance
+
+
+def _run_trial(args, solve=None):
+    """
+    Generate and solve a single instance.
+
+    Runs inside a worker process, so the generator is looked up by name
+    rather than pickled. Each trial draws from its own Random seeded from
+    (run seed, generator, num_vars, trial), so trials are distinct and a
+    run can be replayed regardless of which worker picks them up.
+    """
+    generator_name, num_vars, trial_idx, reuse_solver, use_cache, seed, backend = args
+    if solve is None:
+        # Generated instances are valid by construction, so the solvers
+        # skip validate() and the timing covers solving only
+        if reuse_solver:
+            solve = functools.partial(_solve_with_shared_solver, backend=backend)
+        else:
+            solve = functools.partial(solve_lock, backend=backend, validated=True)
+
+    # Generate instance
+    if use_cache:
+        instance = _cached_generate(generator_name, num_vars, seed, trial_idx)
+    else:
+        rng = _trial_rng(seed, generator_name, num_vars, trial_idx)
+        instance = getattr(lock_generator, generator_name)(num_vars, rng=rng)
+
+    # Collect stats
+    base_vars = num_vars
+    total_dials = instance.num_dials
+    num_clauses = len(instance.clauses)
+    num_negations = len(instance.negations)
+
+    # Solve with timing
+    perf = time.perf_counter
+    start = perf()
+    solution, stats = solve(instance)
+    solve_time = perf() - start
 
-    times = []
-    sat_count = 0
-    instances_data = []
-
-    for trial in range(num_trials):
-        # Generate instance
-        instance = generator_func(num_vars)
-
-        # Collect stats
-        base_vars = num_vars
-        total_dials = instance.num_dials
-        num_clauses = len(instance.clauses)
-        num_negations = len(instance.negations)
-
-        # Solve with timing
-        start = time.time()
-        solution, stats = solve_lock(instance, verbose=False)
-        solve_time = time.time() - start
-
-        times.append(solve_time)
-        if solution:
-            sat_count += 1
-
-        instances_data.append({
-            'trial': trial + 1,
-            'base_vars': base_vars,
-            'total_dials': total_dials,
-            'clauses': num_clauses,
-            'negations': num_negations,
-            'ratio_base': num_clauses / base_vars,
-            'ratio_total': num_clauses / total_dials,
-            'time': solve_time,
-            'sat': solution is not None
-        })
-
-        status = "SAT" if solution else "UNSAT"
-        print(f"  Trial {trial+1:2d}: {solve_time:7.4f}s - {status}")
-
-    # Summary statistics
+    return Trial(
+        trial=trial_idx + 1,
+        base_vars=base_vars,
+        total_dials=total_dials,
+        clauses=num_clauses,
+        negations=num_negations,
+        ratio_base=num_clauses / base_vars,
+        ratio_total=num_clauses / total_dials,
+        time=solve_time,
+        sat=solution is not None
+    )
+
+
+def _median(sorted_values):
+    """Median of an already-sorted, non-empty list"""
+    mid = len(sorted_values) // 2
+    if len(sorted_values) % 2:
+        return sorted_values[mid]
+    return (sorted_values[mid - 1] + sorted_values[mid]) / 2
+
+
+# Sequential stopping rule (--adaptive)
+MIN_ADAPTIVE_TRIALS = 5
+SAT_RATE_HALF_WIDTH = 0.1   # 95% CI on the SAT rate must be within +/-0.1
+MEAN_TIME_REL_ERROR = 0.1   # standard error of the mean time below 10% of it
+
+
+def _wilson_interval(successes, n, z=1.96):
+    """Wilson score interval (default 95%) for a binomial proportion"""
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return center - half, center + half
+
+
+class TrialStats:
+    """
+    Running summary of the trials for one difficulty level.
+
+    Ratios are kept as running sums and solve-time mean/variance with
+    Welford's algorithm, so nothing per trial is retained except the solve
+    time (needed for the median) unless keep_trials is set.
+    """
+
+    def __init__(self, keep_trials=False):
+        self.count = 0
+        self.sat_count = 0
+        self.sum_ratio_base = 0.0
+        self.sum_ratio_total = 0.0
+        self.mean_time = 0.0
+        self._m2_time = 0.0
+        self.times = []
+        self.trials = [] if keep_trials else None
+
+    def add(self, trial):
+        """Fold one Trial record into the running statistics."""
+        self.count += 1
+        if trial.sat:
+            self.sat_count += 1
+        self.sum_ratio_base += trial.ratio_base
+        self.sum_ratio_total += trial.ratio_total
+
+        delta = trial.time - self.mean_time
+        self.mean_time += delta / self.count
+        self._m2_time += delta * (trial.time - self.mean_time)
+
+        self.times.append(trial.time)
+        if self.trials is not None:
+            self.trials.append(trial)
+
+    @property
+    def stdev_time(self):
+        """Sample standard deviation of the solve times."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self._m2_time / (self.count - 1))
+
+    def converged(self):
+        """
+        True once the SAT rate and mean solve time are both pinned down.
+
+        Requires at least MIN_ADAPTIVE_TRIALS trials, a 95% Wilson interval on
+        the SAT rate no wider than +/-SAT_RATE_HALF_WIDTH, and a standard
+        error of the mean solve time below MEAN_TIME_REL_ERROR of the mean.
+        """
+        if self.count < MIN_ADAPTIVE_TRIALS:
+            return False
+        low, high = _wilson_interval(self.sat_count, self.count)
+        if (high - low) / 2 > SAT_RATE_HALF_WIDTH:
+            return False
+        if self.mean_time <= 0:
+            return True
+        stderr = self.stdev_time / math.sqrt(self.count)
+        return stderr / self.mean_time < MEAN_TIME_REL_ERROR
+
+
+def _summarize(name, trial_stats):
+    """Print the summary block for one difficulty and return its result dict"""
+    n = trial_stats.count
+    times = sorted(trial_stats.times)
+    median_time = _median(times)
     print(f"\n{name} Summary:")
-    print(f"  SAT Rate: {sat_count}/{num_trials} ({sat_count/num_trials*100:.1f}%)")
-    print(f"  Mean clause/base ratio: {statistics.mean(d['ratio_base'] for d in instances_data):.2f}")
-    print(f"  Mean clause/dial ratio: {statistics.mean(d['ratio_total'] for d in instances_data):.2f}")
+    print(f"  SAT Rate: {trial_stats.sat_count}/{n} ({trial_stats.sat_count/n*100:.1f}%)")
+    print(f"  Mean clause/base ratio: {trial_stats.sum_ratio_base / n:.2f}")
+    print(f"  Mean clause/dial ratio: {trial_stats.sum_ratio_total / n:.2f}")
     print(f"  Solve Times:")
-    print(f"    Mean:   {statistics.mean(times):.4f}s")
-    print(f"    Median: {statistics.median(times):.4f}s")
-    print(f"    Min:    {min(times):.4f}s")
-    print(f"    Max:    {max(times):.4f}s")
-    if len(times) > 1:
-        print(f"    StdDev: {statistics.stdev(times):.4f}s")
+    print(f"    Mean:   {trial_stats.mean_time:.4f}s")
+    print(f"    Median: {median_time:.4f}s")
+    print(f"    Min:    {times[0]:.4f}s")
+    print(f"    Max:    {times[-1]:.4f}s")
+    if n > 1:
+        print(f"    StdDev: {trial_stats.stdev_time:.4f}s")
 
     return {
         'name': name,
-        'sat_rate': sat_count / num_trials,
-        'mean_time': statistics.mean(times),
-        'median_time': statistics.median(times),
-        'instances': instances_data
+        'sat_rate': trial_stats.sat_count / n,
+        'mean_time': trial_stats.mean_time,
+        'median_time': median_time,
+        'instances': trial_stats.trials
     }
 
 
+def benchmark_difficulty(name, generator_func, num_vars, num_trials, workers=None, cube=0,
+                         keep_trials=False, reuse_solver=False, use_cache=False,
+                         adaptive=False, seed=0, backend=None):
+    """
+    Benchmark a single difficulty level, running trials across worker processes.
+
+    With cube > 0 the trials run one at a time and each solve is split into
+    2^cube cubes that are solved in parallel instead. Per-trial records are
+    only returned under 'instances' when keep_trials is set. With adaptive
+    set, num_trials is an upper bound and the level stops as soon as
+    TrialStats.converged() holds.
+    """
+    print(f"\n{'='*60}")
+    print(f"Benchmarking: {name}")
+    print(f"Variables: {num_vars}, Trials: {num_trials}")
+    print(f"{'='*60}")
+
+    trial_stats = TrialStats(keep_trials=keep_trials)
+
+    trial_args = [(generator_func.__name__, num_vars, trial, reuse_solver, use_cache, seed,
+                   backend)
+                  for trial in range(num_trials)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if cube:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        solve = functools.partial(solve_lock_parallel, k=cube, executor=pool, backend=backend)
+        results = (_run_trial(a, solve) for a in trial_args)
+    elif workers > 1:
+        pool = Pool(processes=workers)
+        results = pool.imap_unordered(_run_trial, trial_args, chunksize=1)
+    else:
+        pool = None
+        results = map(_run_trial, trial_args)
+
+    # Trial lines are buffered and written once per level, so terminal I/O
+    # does not interleave with the timed solves
+    buf = io.StringIO()
+    write = buf.write
+    add_trial = trial_stats.add
+    stopped_early = False
+    try:
+        for data in results:
+            add_trial(data)
+
+            status = "SAT" if data.sat else "UNSAT"
+            write(f"  Trial {data.trial:2d}: {data.time:7.4f}s - {status}\n")
+
+            if adaptive and trial_stats.count < num_trials and trial_stats.converged():
+                stopped_early = True
+                break
+    finally:
+        if isinstance(pool, ProcessPoolExecutor):
+            pool.shutdown()
+        elif pool is not None:
+            if stopped_early:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+    if stopped_early:
+        print(f"  Converged after {trial_stats.count} of {num_trials} trials")
+
+    return _summarize(name, trial_stats)
+
+
+def benchmark_all(difficulties, num_vars, num_trials, workers=None, keep_trials=False,
+                  reuse_solver=False, use_cache=False, adaptive=False, seed=0,
+                  backend=None):
+    """
+    Benchmark every difficulty level in one shared process pool.
+
+    All trials of all levels are submitted up front, so slow levels never
+    leave workers idle while fast ones finish. Trial lines are printed as
+    they complete (tagged with their level) and the per-level summaries
+    follow in the order of `difficulties`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    print(f"\n{'='*60}")
+    print(f"Benchmarking: {', '.join(name for name, _ in difficulties)}")
+    print(f"Variables: {num_vars}, Trials: {num_trials} per level, all levels in one pool")
+    print(f"{'='*60}")
+
+    stats_by_name = {name: TrialStats(keep_trials=keep_trials) for name, _ in difficulties}
+    futures_by_name = {name: [] for name, _ in difficulties}
+    name_of = {}
+    converged = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for trial in range(num_trials):
+            # Interleave levels so every level makes progress from the start
+            for name, func in difficulties:
+                args = (func.__name__, num_vars, trial, reuse_solver, use_cache, seed, backend)
+                future = pool.submit(_run_trial, args)
+                futures_by_name[name].append(future)
+                name_of[future] = name
+
+        for future in as_completed(name_of):
+            name = name_of[future]
+            if future.cancelled() or name in converged:
+                continue
+            data = future.result()
+            trial_stats = stats_by_name[name]
+            trial_stats.add(data)
+
+            status = "SAT" if data.sat else "UNSAT"
+            print(f"  {name:<16} Trial {data.trial:2d}: {data.time:7.4f}s - {status}")
+
+            if adaptive and trial_stats.count < num_trials and trial_stats.converged():
+                converged.add(name)
+                for pending in futures_by_name[name]:
+                    pending.cancel()
+                print(f"  {name} converged after {trial_stats.count} of {num_trials} trials")
+
+    return [_summarize(name, stats_by_name[name]) for name, _ in difficulties]
+
+
 def main():
     parser = argparse.ArgumentParser(description='Benchmark lock generator')
     parser.add_argument('--vars', type=int, default=30,
                         help='Number of variables (default: 30)')
     parser.add_argument('--trials', type=int, default=20,
                         help='Number of trials per difficulty (default: 20)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for running trials (default: CPU count)')
+    parser.add_argument('--cube', type=int, default=0, metavar='K',
+                        help='Cube-and-conquer: split each solve on the first K dials '
+                             'and solve the 2^K cubes in parallel (default: off)')
+    parser.add_argument('--reuse-solver', action='store_true',
+                        help='Keep one incremental SAT solver per worker across trials')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Cache generated instances under {CACHE_DIR}, keyed by '
+                             'seed and generator code (pair with --seed to rerun '
+                             'the same instances)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Stop a difficulty early once its SAT rate (95%% CI within '
+                             '+/-0.1) and mean solve time (stderr < 10%%) are stable; '
+                             '--trials becomes the maximum')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for instance generation; reuse it to replay a run '
+                             '(default: random)')
+    parser.add_argument('--backend', choices=sorted(SAT_BACKENDS), default=None,
+                        help=f'SAT solver backend (default: {DEFAULT_BACKEND}, with a '
+                             f'built-in search for tiny instances)')
+    parser.add_argument('--keep-trials', action='store_true',
+                        help='Keep per-trial records in the results (default: summary only)')
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.seed is None:
+        args.seed = random.randrange(2**32)
 
     print(f"Lock Generator Benchmark")
     print(f"Variables: {args.vars}")
     print(f"Trials per difficulty: {args.trials}")
+    print(f"Workers: {args.workers}")
+    print(f"Seed: {args.seed}")
+    print(f"SAT backend: {args.backend or 'auto'}")
 
     difficulties = [
         ('Trivial', generate_trivial_instance),
@@ -121,10 +547,18 @@ def main():
         ('Phase-Transition', generate_phase_transition_instance),
     ]
 
-    results = []
-    for name, func in difficulties:
-        result = benchmark_difficulty(name, func, args.vars, args.trials)
-        results.append(result)
+    if args.cube or args.workers == 1:
+        # Cube mode parallelizes inside each solve, so levels run one by one
+        results = []
+        for name, func in difficulties:
+            result = benchmark_difficulty(name, func, args.vars, args.trials, args.workers,
+                                          args.cube, args.keep_trials, args.reuse_solver,
+                                          args.cache, args.adaptive, args.seed, args.backend)
+            results.append(result)
+    else:
+        results = benchmark_all(difficulties, args.vars, args.trials, args.workers,
+                                args.keep_trials, args.reuse_solver, args.cache, args.adaptive,
+                                args.seed, args.backend)
 
     # Final comparison
     print(f"\n{'='*60}")
@@ -145,12 +579,12 @@ def main():
 
     if pt_sat_rate < 0.4:
         print("⚠️  Phase-transition SAT rate is too low (<40%)")
-        print("    Consider DECREASING the clause ratio in generate_phase_transition_instance")
-        print("    Try: num_clauses = int(num_vars * 4.1)")
+        print("    Consider DECREASING the 'phase-transition' clause_ratio in DIFFICULTY_PARAMS")
+        print("    Try: clause_ratio=4.1")
     elif pt_sat_rate > 0.6:
         print("⚠️  Phase-transition SAT rate is too high (>60%)")
-        print("    Consider INCREASING the clause ratio in generate_phase_transition_instance")
-        print("    Try: num_clauses = int(num_vars * 4.4)")
+        print("    Consider INCREASING the 'phase-transition' clause_ratio in DIFFICULTY_PARAMS")
+        print("    Try: clause_ratio=4.4")
     else:
         print("✓ Phase-transition SAT rate is in target range (40-60%)")
         print("  Current configuration is well-calibrated")
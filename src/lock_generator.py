@@ -9,12 +9,63 @@ that encode SAT problems.
 import sys
 import os
 import random
+import json
 import argparse
-from datetime import datetime
-from typing import List, Optional, Tuple
+import contextlib
+import functools
+import io
+import multiprocessing
+import time
+from typing import List, Optional, Sequence, Tuple
 from lock_types import LockInstance, LockSolution
 
 
+# Output directories already created by this process
+_DIRS_CREATED = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per process; '' (cwd) is a no-op."""
+    if path and path not in _DIRS_CREATED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_CREATED.add(path)
+
+
+# solve_lock, imported on first use: lock_solver pulls in pysat, which
+# planted and batch (--from-json) runs never need
+_solve_lock = None
+
+
+def _get_solver():
+    """Return lock_solver.solve_lock, importing it on the first call."""
+    global _solve_lock
+    if _solve_lock is None:
+        from lock_solver import solve_lock
+        _solve_lock = solve_lock
+    return _solve_lock
+
+
+def _read_line(prompt: str) -> str:
+    """
+    Read one line of user input, like input(prompt).
+
+    When stdin is not a terminal (scripted or piped input), the line comes
+    straight from sys.stdin.readline() and the prompt is written without a
+    flush, which avoids input()'s per-call prompt flush and is several
+    times faster over long scripted sessions.
+
+    Raises:
+        EOFError: If stdin is exhausted
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
 def get_int_input(prompt: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> int:
     """
     Get validated integer input from the user.
@@ -29,7 +80,14 @@ def get_int_input(prompt: str, min_val: Optional[int] = None, max_val: Optional[
     """
     while True:
         try:
-            value = int(input(prompt))
+            text = _read_line(prompt).strip()
+            # Reject non-numeric input up front rather than through int()'s
+            # exception; ValueError below stays as a backstop
+            digits = text[1:] if text[:1] in ('+', '-') else text
+            if not digits.isdecimal():
+                print("  Error: Please enter a valid integer")
+                continue
+            value = int(text)
             if min_val is not None and value < min_val:
                 print(f"  Error: Value must be at least {min_val}")
                 continue
@@ -58,31 +116,38 @@ def get_dial_indices(prompt: str, count: int, num_dials: int) -> List[int]:
     """
     while True:
         try:
-            user_input = input(prompt)
-            parts = [p.strip() for p in user_input.split(',')]
+            user_input = _read_line(prompt)
+            # int() ignores surrounding whitespace, so no per-token strip
+            parts = user_input.split(',')
 
             if len(parts) != count:
                 print(f"  Error: Expected {count} values, got {len(parts)}")
                 continue
 
-            dials = [int(p) for p in parts]
+            try:
+                dials = list(map(int, parts))
+            except ValueError:
+                print("  Error: Please enter comma-separated integers (e.g., 1, 2, 3)")
+                continue
 
-            # Validate range
-            for dial in dials:
-                if dial < 1 or dial > num_dials:
-                    print(f"  Error: Dial {dial} is out of range [1, {num_dials}]")
-                    raise ValueError("Out of range")
+            # Validate range (report the first offending dial)
+            if min(dials) < 1 or max(dials) > num_dials:
+                bad = next(d for d in dials if d < 1 or d > num_dials)
+                print(f"  Error: Dial {bad} is out of range [1, {num_dials}]")
+                continue
 
-            # Check for duplicates
-            if len(dials) != len(set(dials)):
+            # Check for duplicates (OR clauses compare their 3 dials directly)
+            if count == 3:
+                a, b, c = dials
+                duplicate = a == b or a == c or b == c
+            else:
+                duplicate = len(set(dials)) != count
+            if duplicate:
                 print(f"  Error: Dials must be distinct")
                 continue
 
             return dials
 
-        except ValueError as e:
-            if str(e) != "Out of range":
-                print("  Error: Please enter comma-separated integers (e.g., 1, 2, 3)")
         except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user")
             sys.exit(0)
@@ -166,10 +231,11 @@ def save_instance(instance: LockInstance) -> str:
     Returns:
         Filename where the instance was saved
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f"examples/instances/lock_instance_{timestamp}.json"
 
     try:
+        _ensure_dir("examples/instances")
         instance.save_to_file(filename)
         return filename
     except Exception as e:
@@ -208,158 +274,308 @@ def display_summary(instance: LockInstance) -> None:
     print("=" * 60)
 
 
-def generate_trivial_instance(num_vars):
+@functools.lru_cache(maxsize=16)
+def _dial_population(num_vars: int) -> Tuple[int, ...]:
     """
-    Trivial - always easily satisfiable
-    - Clause/var ratio: ~1.5
-    - No negations used in clauses
-    - Minimal overlap
-    """
-    num_clauses = int(num_vars * 1.5)
+    Return the base dials 1..num_vars as a tuple, cached per num_vars.
 
-    instance = LockInstance(
-        num_dials=num_vars,  # No extra dials needed
-        binary_pins=list(range(1, num_vars + 1)),
-        negations=[],
-        clauses=[]
-    )
+    rng.choices and rng.sample index their population once per draw;
+    indexing a range builds a new int object every time, while a tuple
+    hands out the ints it already holds, which halves the sampling cost.
+    Sweeps reuse the same few sizes, so the tuple is built once per size.
 
-    # Generate non-overlapping clauses
-    for _ in range(num_clauses):
-        clause_vars = random.sample(range(1, num_vars + 1), 3)
-        instance.clauses.append(clause_vars)
+    Args:
+        num_vars: Number of base dials
 
-    return instance
+    Returns:
+        Tuple (1, 2, ..., num_vars)
+    """
+    return tuple(range(1, num_vars + 1))
 
 
-def generate_easy_instance(num_vars):
+def _sample_triples(population: Sequence[int], count: int, rng) -> List[List[int]]:
     """
-    Easy - solvable with basic backtracking
-    - Clause/var ratio: ~2.5
-    - 15% of vars have negation partners
-    - Low negation usage in clauses (20% chance)
-    - Moderate overlap
+    Draw `count` ordered triples of distinct elements of `population`.
+
+    All 3 * count elements are drawn in one rng.choices call and only the
+    rows that came out with a repeat are redrawn with rng.sample, which is
+    several times faster than one rng.sample call per triple. Conditioning
+    i.i.d. draws on distinctness leaves every triple uniform over ordered
+    distinct triples, so the distribution is the same as per-triple sampling.
+
+    Args:
+        population: Values to draw from (needs at least 3 when count > 0)
+        count: Number of triples to draw
+        rng: Random number generator (or the random module) to draw from
+
+    Returns:
+        List of [a, b, c] lists
     """
-    num_clauses = int(num_vars * 2.5)
+    flat = rng.choices(population, k=3 * count)
+    triples = [flat[i:i + 3] for i in range(0, 3 * count, 3)]
+    for triple in triples:
+        a, b, c = triple
+        if a == b or a == c or b == c:
+            triple[:] = rng.sample(population, 3)
+    return triples
 
-    # Create negation partners for 15% of variables
-    num_negations = max(1, int(num_vars * 0.15))
-    num_dials = num_vars + num_negations
 
-    instance = LockInstance(
-        num_dials=num_dials,
-        binary_pins=list(range(1, num_dials + 1)),
-        negations=[],
-        clauses=[]
-    )
+def _negate_literals(clauses: List[List[int]], partner: List[int], prob: float, rng) -> None:
+    """
+    Replace literals by their negation partner dials, in place.
 
-    # Create negation pairs
-    base_vars = list(range(1, num_vars + 1))
-    negation_map = {}
-    next_dial = num_vars + 1
+    Each literal whose dial has a partner (partner[dial] != 0) is swapped
+    with probability prob; dials without a partner draw no random number.
+    The loop body is unrolled for the three literals of a clause, which
+    avoids an inner loop and enumerate() per clause on this hot path.
 
-    for _ in range(num_negations):
-        if not base_vars:
-            break
-        var = random.choice(base_vars)
-        base_vars.remove(var)
+    Args:
+        clauses: Clauses of 3 base dials
+        partner: Dense map from base dial to its negation dial (0 = none)
+        prob: Probability of negating an eligible literal
+        rng: Random number generator (or the random module) to draw from
+    """
+    rand = rng.random
+    for clause in clauses:
+        a, b, c = clause
+        neg_dial = partner[a]
+        if neg_dial and rand() < prob:
+            clause[0] = neg_dial
+        neg_dial = partner[b]
+        if neg_dial and rand() < prob:
+            clause[1] = neg_dial
+        neg_dial = partner[c]
+        if neg_dial and rand() < prob:
+            clause[2] = neg_dial
+
+
+def _add_negation_pairs(instance: LockInstance, base_vars: Sequence[int], num_negations: int,
+                        rng) -> List[int]:
+    """
+    Give randomly chosen base dials a negation partner dial.
 
-        neg_dial = next_dial
-        next_dial += 1
+    Picks min(num_negations, len(base_vars)) distinct base dials with a
+    single rng.sample call and pairs the k-th pick (k = 1, 2, ...) with dial
+    len(base_vars) + k, appending each pair to instance.negations.
 
+    Args:
+        instance: Instance to add the negation links to
+        base_vars: The base dials 1..num_vars (see _dial_population)
+        num_negations: Number of negation partners wanted
+        rng: Random number generator (or the random module) to draw from
+
+    Returns:
+        Dense map from base dial to its negation dial (0 = none)
+    """
+    num_vars = len(base_vars)
+    partner = [0] * (num_vars + 1)
+    picked = rng.sample(base_vars, min(num_negations, num_vars))
+    for neg_dial, var in enumerate(picked, num_vars + 1):
         instance.negations.append([var, neg_dial])
-        negation_map[var] = neg_dial
-        negation_map[neg_dial] = var
+        partner[var] = neg_dial
+    return partner
 
-    # Generate clauses with occasional negated literals
-    all_base_vars = list(range(1, num_vars + 1))
 
-    for _ in range(num_clauses):
-        clause_vars = random.sample(all_base_vars, 3)
+def _sample_clauses(num_vars: int, num_clauses: int,
+                    rng: Optional[random.Random] = None) -> List[List[int]]:
+    """
+    Sample OR clauses of 3 distinct dials drawn uniformly from 1..num_vars.
 
-        # 20% chance to negate each literal (if possible)
-        final_clause = []
-        for var in clause_vars:
-            if var in negation_map and random.random() < 0.2:
-                final_clause.append(negation_map[var])
-            else:
-                final_clause.append(var)
+    Args:
+        num_vars: Number of dials to draw from
+        num_clauses: Number of clauses to generate
+        rng: Random number generator to draw from (default: the random module)
+
+    Returns:
+        List of [dial_i, dial_j, dial_k] clauses
+    """
+    return _sample_triples(_dial_population(num_vars), num_clauses, rng or random)
+
+
+# Generator parameters per difficulty level (see _generate_instance). The
+# phase-transition clause ratio starts at 4.3 and is tuned up/down based on
+# the observed SAT rate.
+DIFFICULTY_PARAMS = {
+    'trivial': dict(clause_ratio=1.5, negation_frac=0.0, min_negations=0,
+                    negation_prob=0.0),
+    'easy': dict(clause_ratio=2.5, negation_frac=0.15, min_negations=1,
+                 negation_prob=0.2),
+    'medium': dict(clause_ratio=3.5, negation_frac=0.30, min_negations=2,
+                   negation_prob=0.4, core_prob=0.5, min_core=8, core_divisor=3,
+                   partial_core=True),
+    'hard': dict(clause_ratio=4.2, negation_frac=0.40, min_negations=3,
+                 negation_prob=0.5, core_prob=0.7, min_core=8, core_divisor=4),
+    'phase-transition': dict(clause_ratio=4.3, negation_frac=0.50, min_negations=4,
+                             negation_prob=0.5, core_prob=0.8, min_core=6,
+                             core_divisor=5),
+}
+
+
+def _generate_instance(num_vars: int, rng, clause_ratio: float, negation_frac: float,
+                       min_negations: int, negation_prob: float, core_prob: float = 0.0,
+                       min_core: int = 0, core_divisor: int = 1, partial_core: bool = False,
+                       plant: bool = False) -> Tuple[LockInstance, Optional[LockSolution]]:
+    """
+    Shared kernel of the difficulty generators.
 
-        instance.clauses.append(final_clause)
+    Base dials 1..num_vars get negation partner dials numbered after them.
+    Each OR clause draws 3 distinct base dials, from a random "core" subset
+    with probability core_prob (which creates overlap between clauses) and
+    from all base dials otherwise, and then negates each literal with a
+    partner with probability negation_prob.
 
-    return instance
+    With plant, a random assignment is drawn first and every clause it
+    violates is redrawn (from the same core or uniform source) until the
+    assignment satisfies it, so the instance is SAT by construction.
 
+    Args:
+        num_vars: Number of base variables
+        rng: Random number generator (or the random module) to draw from
+        clause_ratio: Clauses per base variable
+        negation_frac: Fraction of base variables given a negation partner
+        min_negations: Lower bound on the number of negation partners
+        negation_prob: Probability of negating an eligible literal
+        core_prob: Probability that a clause draws from the core (0 = no core)
+        min_core: Lower bound on the core size
+        core_divisor: Core size is num_vars // core_divisor (at least min_core)
+        partial_core: Draw only 2 or 3 dials (evenly) from the core and fill
+            the clause from all base dials
+        plant: Plant a solution and return it
 
-def generate_medium_instance(num_vars):
-    """
-    Medium - genuinely challenging
-    - Clause/var ratio: ~3.5
-    - 30% of vars have negation partners
-    - 40% negation usage in clauses
-    - High overlap with moderate core
+    Returns:
+        Tuple of (instance, planted solution or None)
     """
-    num_clauses = int(num_vars * 3.5)
+    num_clauses = int(num_vars * clause_ratio)
 
-    # Create negation partners for 30% of variables
-    num_negations = max(2, int(num_vars * 0.30))
+    # Create negation partners for a fraction of variables
+    num_negations = max(min_negations, int(num_vars * negation_frac))
     num_dials = num_vars + num_negations
 
     instance = LockInstance(
         num_dials=num_dials,
-        binary_pins=list(range(1, num_dials + 1)),
+        binary_pins=range(1, num_dials + 1),
         negations=[],
         clauses=[]
     )
 
     # Create negation pairs
-    base_vars = list(range(1, num_vars + 1))
-    negation_map = {}
-    next_dial = num_vars + 1
+    all_vars = _dial_population(num_vars)
+    partner = _add_negation_pairs(instance, all_vars, num_negations, rng)
 
-    for _ in range(num_negations):
-        if not base_vars:
-            break
-        var = random.choice(base_vars)
-        base_vars.remove(var)
+    if partial_core and num_vars < 3:
+        # The rejection fill below could never find a third distinct dial
+        raise ValueError("OR clauses need at least 3 variables")
 
-        neg_dial = next_dial
-        next_dial += 1
+    if core_prob:
+        # Create core for overlap. The core holds at least 3 dials
+        # whenever num_vars >= 3.
+        core_size = max(min_core, num_vars // core_divisor)
+        core_vars = rng.sample(all_vars, min(core_size, num_vars))
 
-        instance.negations.append([var, neg_dial])
-        negation_map[var] = neg_dial
-        negation_map[neg_dial] = var
-
-    # Create moderate core for overlap
-    core_size = max(8, num_vars // 3)
-    core_vars = random.sample(range(1, num_vars + 1), min(core_size, num_vars))
-    all_vars = list(range(1, num_vars + 1))
-
-    # Generate clauses
-    for _ in range(num_clauses):
-        # 50% use core variables
-        if random.random() < 0.5:
-            num_from_core = random.randint(2, 3)
-            clause_vars = random.sample(core_vars, min(num_from_core, len(core_vars)))
-            while len(clause_vars) < 3:
-                remaining = [v for v in all_vars if v not in clause_vars]
-                clause_vars.append(random.choice(remaining))
+        # Decide core vs. all variables per clause
+        from_core = [rng.random() < core_prob for _ in range(num_clauses)]
+    else:
+        core_vars = all_vars
+        from_core = None
+
+    def draw(from_core: Optional[List[bool]], count: int) -> List[List[int]]:
+        """Draw `count` clauses, each group (core / all dials) in one batch."""
+        if from_core is None:
+            return _sample_triples(all_vars, count, rng)
+        num_core = from_core.count(True)
+        if partial_core:
+            # A core clause takes 2 or 3 core dials (evenly): draw a core
+            # triple for every core clause in one batch and, for the
+            # 2-dial ones, overwrite the third slot with any base dial
+            # outside the first two (rejection; a retry is rare)
+            core_triples = _sample_triples(core_vars, num_core, rng)
+            fills = rng.choices(all_vars, k=num_core)
+            two_from_core = rng.choices((False, True), k=num_core)
+            randint = rng.randint
+            for triple, var, refill in zip(core_triples, fills, two_from_core):
+                if refill:
+                    a, b, _ = triple
+                    while var == a or var == b:
+                        var = randint(1, num_vars)
+                    triple[2] = var
+            core_triples = iter(core_triples)
         else:
-            clause_vars = random.sample(all_vars, 3)
+            core_triples = iter(_sample_triples(core_vars, num_core, rng))
+        other_triples = iter(_sample_triples(all_vars, count - num_core, rng))
+        return [next(core_triples) if use_core else next(other_triples)
+                for use_core in from_core]
+
+    clauses = draw(from_core, num_clauses)
+
+    # Negate literals with partners
+    _negate_literals(clauses, partner, negation_prob, rng)
+
+    solution = None
+    if plant:
+        # Random base assignment with a TRUE dial in the core, so that
+        # every clause source can produce a satisfied clause
+        truth = [False] + rng.choices((False, True), k=num_vars) + [False] * num_negations
+        if num_vars and not any(truth[var] for var in core_vars):
+            truth[rng.choice(core_vars)] = True
+        for var, neg_dial in instance.negations:
+            truth[neg_dial] = not truth[var]
+
+        # Redraw violated clauses from their own source until none is left
+        bad = [i for i, (a, b, c) in enumerate(clauses)
+               if not (truth[a] or truth[b] or truth[c])]
+        while bad:
+            redrawn = draw(None if from_core is None else [from_core[i] for i in bad],
+                           len(bad))
+            _negate_literals(redrawn, partner, negation_prob, rng)
+            for i, clause in zip(bad, redrawn):
+                clauses[i] = clause
+            bad = [i for i in bad
+                   if not (truth[clauses[i][0]] or truth[clauses[i][1]] or truth[clauses[i][2]])]
+
+        solution = LockSolution(dial_values={
+            dial: 6 if truth[dial] else 1 for dial in range(1, num_dials + 1)
+        })
+
+    instance.clauses.extend(clauses)
+    return instance, solution
+
+
+def generate_trivial_instance(num_vars: int, rng: Optional[random.Random] = None) -> LockInstance:
+    """
+    Trivial - always easily satisfiable
+    - Clause/var ratio: ~1.5
+    - No negations used in clauses
+    - Minimal overlap
+    """
+    instance, _ = _generate_instance(num_vars, rng or random, **DIFFICULTY_PARAMS['trivial'])
+    return instance
 
-        # 40% chance to negate each literal
-        final_clause = []
-        for var in clause_vars:
-            if var in negation_map and random.random() < 0.4:
-                final_clause.append(negation_map[var])
-            else:
-                final_clause.append(var)
 
-        instance.clauses.append(final_clause)
+def generate_easy_instance(num_vars: int, rng: Optional[random.Random] = None) -> LockInstance:
+    """
+    Easy - solvable with basic backtracking
+    - Clause/var ratio: ~2.5
+    - 15% of vars have negation partners
+    - Low negation usage in clauses (20% chance)
+    - Moderate overlap
+    """
+    instance, _ = _generate_instance(num_vars, rng or random, **DIFFICULTY_PARAMS['easy'])
+    return instance
+
 
+def generate_medium_instance(num_vars: int, rng: Optional[random.Random] = None) -> LockInstance:
+    """
+    Medium - genuinely challenging
+    - Clause/var ratio: ~3.5
+    - 30% of vars have negation partners
+    - 40% negation usage in clauses
+    - High overlap with moderate core
+    """
+    instance, _ = _generate_instance(num_vars, rng or random, **DIFFICULTY_PARAMS['medium'])
     return instance
 
 
-def generate_hard_instance(num_vars):
+def generate_hard_instance(num_vars: int, rng: Optional[random.Random] = None) -> LockInstance:
     """
     Hard - very challenging, mostly SAT
     - Clause/var ratio: ~4.2
@@ -367,68 +583,11 @@ def generate_hard_instance(num_vars):
     - 50% negation usage in clauses
     - Very high overlap with tight core
     """
-    num_clauses = int(num_vars * 4.2)
-
-    # Create negation partners for 40% of variables
-    num_negations = max(3, int(num_vars * 0.40))
-    num_dials = num_vars + num_negations
-
-    instance = LockInstance(
-        num_dials=num_dials,
-        binary_pins=list(range(1, num_dials + 1)),
-        negations=[],
-        clauses=[]
-    )
-
-    # Create negation pairs
-    base_vars = list(range(1, num_vars + 1))
-    negation_map = {}
-    next_dial = num_vars + 1
-
-    for _ in range(num_negations):
-        if not base_vars:
-            break
-        var = random.choice(base_vars)
-        base_vars.remove(var)
-
-        neg_dial = next_dial
-        next_dial += 1
-
-        instance.negations.append([var, neg_dial])
-        negation_map[var] = neg_dial
-        negation_map[neg_dial] = var
-
-    # Create tight core for maximum overlap
-    core_size = max(8, num_vars // 4)
-    core_vars = random.sample(range(1, num_vars + 1), min(core_size, num_vars))
-    all_vars = list(range(1, num_vars + 1))
-
-    # Generate highly overlapping clauses
-    for _ in range(num_clauses):
-        # 70% use core variables
-        if random.random() < 0.7:
-            num_from_core = 3
-            clause_vars = random.sample(core_vars, min(3, len(core_vars)))
-            while len(clause_vars) < 3:
-                remaining = [v for v in all_vars if v not in clause_vars]
-                clause_vars.append(random.choice(remaining))
-        else:
-            clause_vars = random.sample(all_vars, 3)
-
-        # 50% chance to negate each literal
-        final_clause = []
-        for var in clause_vars:
-            if var in negation_map and random.random() < 0.5:
-                final_clause.append(negation_map[var])
-            else:
-                final_clause.append(var)
-
-        instance.clauses.append(final_clause)
-
+    instance, _ = _generate_instance(num_vars, rng or random, **DIFFICULTY_PARAMS['hard'])
     return instance
 
 
-def generate_phase_transition_instance(num_vars):
+def generate_phase_transition_instance(num_vars: int, rng: Optional[random.Random] = None) -> LockInstance:
     """
     Phase Transition - at SAT/UNSAT boundary
     - Clause/var ratio: ~4.2-4.5 (empirically tuned)
@@ -440,68 +599,41 @@ def generate_phase_transition_instance(num_vars):
     Note: The exact threshold is tuned empirically for this constraint model,
     not the standard 3-SAT value of 4.26 (which applies to different distributions).
     """
-    # Start at 4.3, tune up/down based on observed SAT rate
-    num_clauses = int(num_vars * 4.3)
-
-    # Create negation partners for 50% of variables
-    num_negations = max(4, int(num_vars * 0.50))
-    num_dials = num_vars + num_negations
-
-    instance = LockInstance(
-        num_dials=num_dials,
-        binary_pins=list(range(1, num_dials + 1)),
-        negations=[],
-        clauses=[]
-    )
+    instance, _ = _generate_instance(num_vars, rng or random,
+                                     **DIFFICULTY_PARAMS['phase-transition'])
+    return instance
 
-    # Create negation pairs
-    base_vars = list(range(1, num_vars + 1))
-    negation_map = {}
-    next_dial = num_vars + 1
 
-    for _ in range(num_negations):
-        if not base_vars:
-            break
-        var = random.choice(base_vars)
-        base_vars.remove(var)
+def generate_planted_instance(num_vars: int, difficulty: str = 'easy',
+                              rng: Optional[random.Random] = None) -> Tuple[LockInstance, LockSolution]:
+    """
+    Generate a SAT instance of the given difficulty with a planted solution.
 
-        neg_dial = next_dial
-        next_dial += 1
+    Uses the difficulty's generator parameters, but redraws every clause the
+    planted assignment violates, so no solver call is needed to know the
+    instance is SAT or to obtain a solution. Planted instances are SAT by
+    construction and are therefore not a sample of the plain generator's
+    SAT/UNSAT distribution.
 
-        instance.negations.append([var, neg_dial])
-        negation_map[var] = neg_dial
-        negation_map[neg_dial] = var
-
-    # Very small core for maximum entanglement
-    core_size = max(6, num_vars // 5)
-    core_vars = random.sample(range(1, num_vars + 1), min(core_size, num_vars))
-    all_vars = list(range(1, num_vars + 1))
-
-    # Generate maximally overlapping clauses
-    for _ in range(num_clauses):
-        # 80% use core
-        if random.random() < 0.8:
-            clause_vars = random.sample(core_vars, min(3, len(core_vars)))
-            while len(clause_vars) < 3:
-                remaining = [v for v in all_vars if v not in clause_vars]
-                clause_vars.append(random.choice(remaining))
-        else:
-            clause_vars = random.sample(all_vars, 3)
-
-        # 50% chance to negate each literal
-        final_clause = []
-        for var in clause_vars:
-            if var in negation_map and random.random() < 0.5:
-                final_clause.append(negation_map[var])
-            else:
-                final_clause.append(var)
+    Args:
+        num_vars: Number of base variables
+        difficulty: Difficulty level (a key of DIFFICULTY_PARAMS)
+        rng: Random number generator to draw from (default: the random module)
 
-        instance.clauses.append(final_clause)
+    Returns:
+        Tuple of (instance, planted solution)
 
-    return instance
+    Raises:
+        ValueError: If the difficulty is unknown
+    """
+    if difficulty not in DIFFICULTY_PARAMS:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    return _generate_instance(num_vars, rng or random, plant=True,
+                              **DIFFICULTY_PARAMS[difficulty])
 
 
-def generate_random_instance(num_vars: int, num_clauses: int, negation_prob: float = 0.2) -> LockInstance:
+def generate_random_instance(num_vars: int, num_clauses: int, negation_prob: float = 0.2,
+                             rng: Optional[random.Random] = None) -> LockInstance:
     """
     DEPRECATED: Use difficulty-specific generators instead.
 
@@ -511,32 +643,25 @@ def generate_random_instance(num_vars: int, num_clauses: int, negation_prob: flo
         num_vars: Number of variables (dials)
         num_clauses: Number of OR clauses to generate
         negation_prob: Probability of adding negation links (default 20%)
+        rng: Random number generator to draw from (default: the random module)
 
     Returns:
         Randomly generated LockInstance
     """
     # All dials are binary-pinned
-    binary_pins = list(range(1, num_vars + 1))
+    binary_pins = range(1, num_vars + 1)
 
     # Generate negation links (20% of variables get a negated version)
-    negations = []
     num_negations = int(num_vars * negation_prob)
 
-    # Randomly select pairs for negation links
-    available_dials = list(range(1, num_vars + 1))
-    random.shuffle(available_dials)
-
-    for i in range(0, min(num_negations * 2, len(available_dials)) - 1, 2):
-        dial_i = available_dials[i]
-        dial_j = available_dials[i + 1]
-        negations.append([dial_i, dial_j])
+    # Randomly select disjoint pairs for negation links: one sample of just
+    # the paired dials, instead of shuffling every dial
+    num_pairs = min(num_negations, num_vars // 2)
+    picked = (rng or random).sample(_dial_population(num_vars), 2 * num_pairs)
+    negations = [picked[i:i + 2] for i in range(0, 2 * num_pairs, 2)]
 
     # Generate random OR clauses
-    clauses = []
-    for _ in range(num_clauses):
-        # Randomly select 3 distinct dials
-        selected_dials = random.sample(range(1, num_vars + 1), 3)
-        clauses.append(selected_dials)
+    clauses = _sample_clauses(num_vars, num_clauses, rng)
 
     instance = LockInstance(
         num_dials=num_vars,
@@ -548,108 +673,251 @@ def generate_random_instance(num_vars: int, num_clauses: int, negation_prob: flo
     return instance
 
 
-def auto_generate(num_vars: int, difficulty: str = 'easy', output: Optional[str] = None) -> Tuple[str, str]:
+# Instances auto_generate will generate before giving up on a solver that
+# keeps returning invalid solutions
+AUTO_GENERATE_MAX_ATTEMPTS = 5
+
+
+def auto_generate(num_vars: int, difficulty: str = 'easy', output: Optional[str] = None,
+                  seed: Optional[int] = None, quiet: bool = False,
+                  planted: bool = False, suffix: str = '') -> Tuple[str, str]:
     """
     Automatically generate and solve a random lock instance.
 
+    With planted, the instance is generated around a planted solution
+    (see generate_planted_instance) and the solver is not called.
+
+    The progress report is collected per step and written to stdout in one
+    call before and one call after solving, instead of a print() per line.
+
     Args:
         num_vars: Number of base variables
         difficulty: Difficulty level ('trivial', 'easy', 'medium', 'hard', 'phase-transition')
         output: Optional base filename (without extension)
+        seed: Optional seed for a private random generator; the same seed
+            reproduces the same instance
+        quiet: Only report the saved file paths
+        planted: Plant a solution instead of solving (always SAT)
+        suffix: Appended to the file base name (keeps batch jobs that share
+            a timestamp from overwriting each other)
 
     Returns:
         Tuple of (instance_filename, solution_filename)
+
+    Raises:
+        ValueError: If the difficulty is unknown
+        RuntimeError: If every attempt yields an invalid solution
     """
-    from lock_solver import solve_lock
-    import time
-    import os
+    generators = {
+        'trivial': generate_trivial_instance,
+        'easy': generate_easy_instance,
+        'medium': generate_medium_instance,
+        'hard': generate_hard_instance,
+        'phase-transition': generate_phase_transition_instance,
+    }
+    if difficulty not in generators:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    generate = generators[difficulty]
+    rng = random.Random(seed)
 
-    print(f"\nGenerating {difficulty} instance with {num_vars} base variables...")
-    print()
+    def emit(msg: List[str]) -> None:
+        if not quiet:
+            sys.stdout.write("\n".join(msg) + "\n")
+            sys.stdout.flush()
 
-    # Generate based on difficulty
-    if difficulty == 'trivial':
-        instance = generate_trivial_instance(num_vars)
-    elif difficulty == 'easy':
-        instance = generate_easy_instance(num_vars)
-    elif difficulty == 'medium':
-        instance = generate_medium_instance(num_vars)
-    elif difficulty == 'hard':
-        instance = generate_hard_instance(num_vars)
-    elif difficulty == 'phase-transition':
-        instance = generate_phase_transition_instance(num_vars)
-    else:
-        raise ValueError(f"Unknown difficulty: {difficulty}")
+    for _ in range(AUTO_GENERATE_MAX_ATTEMPTS):
+        if planted:
+            instance, solution = generate_planted_instance(num_vars, difficulty, rng)
+        else:
+            instance = generate(num_vars, rng)
+
+        # CLEAR REPORTING OF BOTH RATIOS
+        base_vars = num_vars
+        total_dials = instance.num_dials
+        num_clauses = len(instance.clauses)
+        num_negations = len(instance.negations)
+
+        emit([
+            f"\nGenerating {difficulty} instance with {num_vars} base variables...",
+            "",
+            "Generated Instance Statistics:",
+            f"  Base variables: {base_vars}",
+            f"  Total dials (including negation partners): {total_dials}",
+            f"  Negation pairs: {num_negations}",
+            f"  Clauses: {num_clauses}",
+            f"  Clause/base-var ratio: {num_clauses / base_vars:.2f}",
+            f"  Clause/total-dial ratio: {num_clauses / total_dials:.2f}",
+            "",
+        ])
+
+        if planted:
+            msg = ["✓ Instance is SAT (planted solution, solver skipped)"]
+        else:
+            emit(["Attempting to solve..."])
 
-    # CLEAR REPORTING OF BOTH RATIOS
-    base_vars = num_vars
-    total_dials = instance.num_dials
-    num_clauses = len(instance.clauses)
-    num_negations = len(instance.negations)
-
-    print(f"Generated Instance Statistics:")
-    print(f"  Base variables: {base_vars}")
-    print(f"  Total dials (including negation partners): {total_dials}")
-    print(f"  Negation pairs: {num_negations}")
-    print(f"  Clauses: {num_clauses}")
-    print(f"  Clause/base-var ratio: {num_clauses / base_vars:.2f}")
-    print(f"  Clause/total-dial ratio: {num_clauses / total_dials:.2f}")
-    print()
+            # Try to solve with timing
+            start_time = time.perf_counter()
+            # Generated instances are valid by construction
+            solution, stats = _get_solver()(instance, verbose=False, validated=True)
+            solve_time = time.perf_counter() - start_time
 
-    # Try to solve with timing
-    print("Attempting to solve...")
-    start_time = time.time()
-    solution, stats = solve_lock(instance, verbose=False)
-    solve_time = time.time() - start_time
+            if not solution:
+                emit([f"✗ Instance is UNSAT (proved in {solve_time:.4f}s)", ""])
+                break
 
-    if solution:
-        print(f"✓ Instance is SAT (solved in {solve_time:.4f}s)")
-        print()
+            msg = [f"✓ Instance is SAT (solved in {solve_time:.4f}s)"]
+        msg += ["", "Validating solution..."]
 
         # CRITICAL: Validate solution before saving
-        print("Validating solution...")
         is_valid, error_msg = solution.validate(instance)
 
-        if not is_valid:
-            print(f"\n❌ ERROR: Solver produced invalid solution!")
-            print(f"Validation error: {error_msg}")
-            print("\n⚠️  Not saving invalid solution. Regenerating...")
-            # Try again - the solver should never produce invalid solutions,
-            # but we validate to be safe
-            return auto_generate(num_vars, difficulty, output)
+        if is_valid:
+            msg += ["✓ Solution validated", ""]
+            emit(msg)
+            break
 
-        print("✓ Solution validated")
-        print()
+        # The solver should never produce invalid solutions, but we
+        # validate to be safe and regenerate rather than save a bad one
+        # (reported even when quiet)
+        msg += [
+            "\n❌ ERROR: Solver produced invalid solution!",
+            f"Validation error: {error_msg}",
+            "\n⚠️  Not saving invalid solution. Regenerating...",
+        ]
+        sys.stdout.write("\n".join(msg) + "\n")
     else:
-        print(f"✗ Instance is UNSAT (proved in {solve_time:.4f}s)")
-        print()
+        raise RuntimeError(
+            f"Solver produced an invalid solution on all {AUTO_GENERATE_MAX_ATTEMPTS} attempts"
+        )
 
     # Generate filenames with difficulty in name
     if output:
-        instance_file = f"{output}_instance.json"
-        solution_file = f"{output}_solution.json"
+        instance_file = f"{output}{suffix}_instance.json"
+        solution_file = f"{output}{suffix}_solution.json"
     else:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename_base = f"{difficulty}_{base_vars}vars_{timestamp}"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename_base = f"{difficulty}_{base_vars}vars_{timestamp}{suffix}"
         instance_file = f"examples/instances/{filename_base}.json"
         solution_file = f"examples/solutions/{filename_base}.json"
 
-    # Save files
-    print("Saving files...")
-
-    # Ensure directories exist
-    os.makedirs("examples/instances", exist_ok=True)
+    # Save files (directories are created on first use)
+    _ensure_dir(os.path.dirname(instance_file))
     instance.save_to_file(instance_file)
-    print(f"✓ Instance saved to: {instance_file}")
+    saved = [instance_file]
 
     if solution:
-        os.makedirs("examples/solutions", exist_ok=True)
+        _ensure_dir(os.path.dirname(solution_file))
         solution.save_to_file(solution_file)
-        print(f"✓ Solution saved to: {solution_file}")
+        saved.append(solution_file)
+
+    if quiet:
+        sys.stdout.write("\n".join(saved) + "\n")
+    else:
+        msg = ["Saving files...", f"✓ Instance saved to: {instance_file}"]
+        if solution:
+            msg.append(f"✓ Solution saved to: {solution_file}")
+        emit(msg)
 
     return instance_file, solution_file
 
 
+def _auto_generate_job(job: Tuple[int, int, str, Optional[str], Optional[int], bool]
+                       ) -> Tuple[int, Tuple[str, str], str]:
+    """Run one quiet auto_generate call for auto_generate_batch."""
+    index, num_vars, difficulty, output, seed, planted = job
+    # Capture the report so the parent writes it (pool workers exit without
+    # flushing stdout, and unflushed lines from several workers would mix)
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        files = auto_generate(num_vars, difficulty, output, seed=seed, quiet=True,
+                              planted=planted, suffix=f"_{index:03d}")
+    return index, files, report.getvalue()
+
+
+def auto_generate_batch(num_vars: int, difficulty: str = 'easy', count: int = 1,
+                        output: Optional[str] = None, seed: Optional[int] = None,
+                        planted: bool = False,
+                        processes: Optional[int] = None) -> List[Tuple[str, str]]:
+    """
+    Generate and solve several independent instances in parallel.
+
+    Each instance runs auto_generate in its own worker process, so sweeps
+    scale with the number of cores. Job k is written with a '_k' suffix
+    (zero-padded) on the file base name. Each worker's quiet report is
+    written to stdout as the job finishes.
+
+    Args:
+        num_vars: Number of base variables
+        difficulty: Difficulty level ('trivial', 'easy', 'medium', 'hard', 'phase-transition')
+        count: Number of instances to generate
+        output: Optional base filename (without extension)
+        seed: Optional seed; job k uses seed + k, so a batch is reproducible.
+            Without a seed every worker seeds itself from the OS.
+        planted: Plant a solution instead of solving (always SAT)
+        processes: Worker processes (default: os.cpu_count()); 1 runs the
+            jobs in this process
+
+    Returns:
+        List of (instance_filename, solution_filename), in job order
+
+    Raises:
+        ValueError: If the difficulty is unknown or count is less than 1
+    """
+    if difficulty not in DIFFICULTY_PARAMS:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    if count < 1:
+        raise ValueError(f"count must be at least 1, got {count}")
+
+    jobs = [(k, num_vars, difficulty, output, None if seed is None else seed + k, planted)
+            for k in range(count)]
+    processes = min(processes or os.cpu_count() or 1, count)
+    results: List[Optional[Tuple[str, str]]] = [None] * count
+
+    def collect(done) -> None:
+        for index, files, report in done:
+            results[index] = files
+            sys.stdout.write(report)
+            sys.stdout.flush()
+
+    if processes == 1:
+        collect(map(_auto_generate_job, jobs))
+    else:
+        with multiprocessing.Pool(processes=processes) as pool:
+            collect(pool.imap_unordered(_auto_generate_job, jobs))
+    return results
+
+
+def instance_from_spec(spec: dict, num_dials: Optional[int] = None) -> LockInstance:
+    """
+    Build a lock instance from a JSON spec in a single pass.
+
+    The spec uses the instance file format. binary_pins defaults to all dials,
+    and num_dials may be omitted from the spec if it is passed in directly
+    (an explicit num_dials argument takes precedence).
+
+    Args:
+        spec: Dictionary with negations, clauses and optionally num_dials/binary_pins
+        num_dials: Number of dials, overriding spec["num_dials"]
+
+    Returns:
+        Validated LockInstance
+
+    Raises:
+        ValueError: If the spec is incomplete or describes an invalid lock
+    """
+    if num_dials is None:
+        if "num_dials" not in spec:
+            raise ValueError("Missing required field: 'num_dials' (or pass --num-dials)")
+        num_dials = spec["num_dials"]
+
+    return LockInstance.from_json({
+        "num_dials": num_dials,
+        "binary_pins": spec.get("binary_pins", list(range(1, num_dials + 1))),
+        "negations": spec.get("negations", []),
+        "clauses": spec.get("clauses", [])
+    })
+
+
 def interactive_mode():
     """Run the interactive lock generator."""
     print_header()
@@ -660,7 +928,7 @@ def interactive_mode():
     print()
 
     # Create instance with all dials binary-pinned
-    binary_pins = list(range(1, num_dials + 1))
+    binary_pins = range(1, num_dials + 1)
     instance = LockInstance(
         num_dials=num_dials,
         binary_pins=binary_pins,
@@ -701,7 +969,7 @@ def interactive_mode():
 
             display_summary(instance)
 
-            confirm = input("\nSave this configuration? (yes/no): ").strip().lower()
+            confirm = _read_line("\nSave this configuration? (yes/no): ").strip().lower()
             if confirm in ['yes', 'y']:
                 try:
                     filename = save_instance(instance)
@@ -713,7 +981,7 @@ def interactive_mode():
             else:
                 print("Save cancelled. Returning to menu...")
         elif choice == 5:
-            confirm = input("\nAre you sure you want to exit without saving? (yes/no): ").strip().lower()
+            confirm = _read_line("\nAre you sure you want to exit without saving? (yes/no): ").strip().lower()
             if confirm in ['yes', 'y']:
                 print("\nExiting without saving. Goodbye!")
                 sys.exit(0)
@@ -740,6 +1008,21 @@ Examples:
 
   # Auto-generate with custom output filename
   python lock_generator.py --auto --vars 15 --difficulty medium --output my_lock
+
+  # Reproducible instance: the same seed gives the same lock
+  python lock_generator.py --auto --vars 20 --difficulty hard --seed 42
+
+  # Known-SAT instance with a planted solution (no solver call)
+  python lock_generator.py --auto --vars 500 --difficulty hard --planted
+
+  # Scripted sweeps: print only the saved file paths
+  python lock_generator.py --auto --vars 20 --quiet
+
+  # Sweep: 16 independent instances, one worker process per core
+  python lock_generator.py --auto --vars 200 --difficulty hard --batch 16
+
+  # Batch: build an instance from a JSON spec without prompts
+  python lock_generator.py --from-json spec.json --output my_lock
         """
     )
 
@@ -753,9 +1036,51 @@ Examples:
                         help='Difficulty level: trivial, easy, medium, hard, phase-transition (default: easy)')
     parser.add_argument('--output', type=str, metavar='FILE',
                         help='Output file base name (without extension)')
+    parser.add_argument('--seed', type=int, metavar='N',
+                        help='Random seed for auto mode (reproducible instances)')
+    parser.add_argument('--planted', action='store_true',
+                        help='Auto mode: plant a solution instead of running the solver '
+                             '(always SAT)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Auto mode: print only the saved file paths')
+    parser.add_argument('--batch', type=int, metavar='N',
+                        help='Auto mode: generate N independent instances in parallel')
+    parser.add_argument('--from-json', type=str, metavar='SPEC',
+                        help='Build the instance from a JSON spec (negations, clauses, ...) '
+                             'instead of prompting')
+    parser.add_argument('--num-dials', type=int, metavar='N',
+                        help='Number of dials for --from-json (overrides the spec)')
 
     args = parser.parse_args()
 
+    if args.num_dials is not None and not args.from_json:
+        parser.error("--num-dials can only be used with --from-json")
+
+    # Batch mode: one JSON load, no prompts
+    if args.from_json:
+        if (args.auto or args.vars or args.difficulty != 'easy' or args.seed is not None
+                or args.quiet or args.planted or args.batch is not None):
+            parser.error("--from-json cannot be combined with --auto, --vars, --difficulty, "
+                         "--seed, --quiet, --planted or --batch")
+
+        try:
+            with open(args.from_json, 'r') as f:
+                spec = json.load(f)
+            instance = instance_from_spec(spec, args.num_dials)
+            if args.output:
+                filename = f"{args.output}_instance.json"
+                instance.save_to_file(filename)
+            else:
+                filename = save_instance(instance)
+            print(f"✓ Lock instance saved to: {filename}")
+        except FileNotFoundError:
+            print(f"Error: File not found: {args.from_json}")
+            sys.exit(1)
+        except (ValueError, TypeError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
     # Auto mode
     if args.auto:
         if not args.vars:
@@ -764,13 +1089,28 @@ Examples:
         if args.vars < 3:
             parser.error("--vars must be at least 3")
 
+        if args.batch is not None:
+            if args.batch < 1:
+                parser.error("--batch must be at least 1")
+            try:
+                auto_generate_batch(args.vars, args.difficulty, args.batch, args.output,
+                                    seed=args.seed, planted=args.planted)
+            except Exception as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            return
+
         try:
-            print_header()
-            instance_file, solution_file = auto_generate(args.vars, args.difficulty, args.output)
-            print()
-            print("=" * 60)
-            print("Auto-generation complete!")
-            print("=" * 60)
+            if not args.quiet:
+                print_header()
+            instance_file, solution_file = auto_generate(args.vars, args.difficulty, args.output,
+                                                       seed=args.seed, quiet=args.quiet,
+                                                       planted=args.planted)
+            if not args.quiet:
+                print()
+                print("=" * 60)
+                print("Auto-generation complete!")
+                print("=" * 60)
         except Exception as e:
             print(f"Error: {e}")
             import traceback
@@ -778,8 +1118,10 @@ Examples:
             sys.exit(1)
     else:
         # Interactive mode
-        if args.vars or args.difficulty != 'easy' or args.output:
-            parser.error("--vars, --difficulty, and --output can only be used with --auto")
+        if (args.vars or args.difficulty != 'easy' or args.output or args.seed is not None
+                or args.quiet or args.planted or args.batch is not None):
+            parser.error("--vars, --difficulty, --output, --seed, --quiet, --planted, "
+                         "and --batch can only be used with --auto")
 
         try:
             interactive_mode()
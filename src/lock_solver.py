@@ -6,14 +6,400 @@ This module converts lock constraints into SAT clauses and uses a SAT solver
 to find solutions.
 """
 
+import hashlib
+import json
+import sqlite3
 import sys
 import time
-from typing import Optional, Tuple
-from pysat.solvers import Glucose3
-from lock_types import LockInstance, LockSolution
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from lock_types import LockInstance, LockSolution, DATACLASS_OPTIONS
 
 
-def solve_lock(instance: LockInstance, verbose: bool = False) -> Tuple[Optional[LockSolution], dict]:
+# SAT backends selectable by name (pysat class names). Glucose3 stays the
+# default: on generated instances up to 1000 vars it matched Glucose42 and
+# beat Cadical195, whose per-solver setup dominates on these small CNFs.
+SAT_BACKENDS = {
+    'glucose3': 'Glucose3',
+    'glucose42': 'Glucose42',
+    'cadical195': 'Cadical195',
+    'minisat22': 'Minisat22',
+}
+DEFAULT_BACKEND = 'glucose3'
+
+# Backend name that forces the pure-Python search (_solve_tiny) at any size:
+# deterministic and pysat-free, but only practical for small instances
+BUILTIN_BACKEND = 'builtin'
+
+
+def new_sat_solver(backend: str = DEFAULT_BACKEND) -> Any:
+    """
+    Create an empty pysat solver for the named backend.
+
+    Raises:
+        ValueError: If the backend is unknown or missing from the installed pysat
+    """
+    # Imported on first use: loading pysat's compiled solvers costs more than
+    # the rest of this module, and CLI usage errors and tiny instances
+    # (decided in pure Python) never need them
+    import pysat.solvers
+
+    solver_class = getattr(pysat.solvers, SAT_BACKENDS.get(backend, ''), None)
+    if solver_class is None:
+        raise ValueError(f"Unknown or unavailable SAT backend: {backend} "
+                         f"(choose from {', '.join(SAT_BACKENDS)})")
+    return solver_class()
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class SolveStats:
+    """
+    Statistics of one solve_lock call.
+
+    Fields are read as attributes (stats.solve_time); stats['solve_time']
+    and 'solve_time' in stats also work, as for the dict this replaces.
+
+    Attributes:
+        num_variables: Number of SAT variables (dials)
+        num_clauses: Number of clauses handed to the solver (for instances
+            decided without a search, the size of their CNF encoding)
+        duplicates_removed: Repeated clauses dropped before solving
+        solve_time: Time spent deciding the CNF, in seconds
+        satisfiable: Whether a solution was found
+        cache_hit: Whether the result came from a SolutionCache (no CNF was
+            built and num_clauses is 0)
+    """
+    num_variables: int
+    num_clauses: int = 0
+    duplicates_removed: int = 0
+    solve_time: float = 0.0
+    satisfiable: bool = False
+    cache_hit: bool = False
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__dataclass_fields__
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain (JSON-serializable) dictionary."""
+        return asdict(self)
+
+
+def _dedup_clauses(cnf: List[List[int]]) -> List[List[int]]:
+    """
+    Drop repeated clauses, keeping the first position of each.
+
+    Clauses are compared as literal sets, so [1, 2, 3] repeats [3, 1, 2]
+    and a negation given as both [i, j] and [j, i] is encoded only once.
+    """
+    return list({frozenset(clause): clause for clause in cnf}.values())
+
+
+def quick_unsat_check(instance: LockInstance) -> bool:
+    """
+    Cheap sufficient test for unsatisfiability, run before any SAT search.
+
+    Each negation link is the GF(2) equation x_i XOR x_j = 1. A union-find
+    that tracks every dial's parity relative to its root solves this system
+    in near-linear time: joining two dials already in one component either
+    agrees with their parities or proves the links contradictory (e.g. an
+    odd cycle Not(1,2), Not(2,3), Not(1,3)). OR clauses are positive, so
+    they can never make consistent links contradictory.
+
+    Args:
+        instance: The lock instance to check
+
+    Returns:
+        True if the negation links alone make the instance UNSAT; False if
+        the test is inconclusive
+    """
+    negations = instance.negations
+    dials = [dial for pair in negations for dial in pair]
+    if len(set(dials)) == len(dials):
+        return False  # Disjoint pairs (as generated) cannot form a cycle
+    return _negation_parities(negations) is None
+
+
+def _negation_parities(negations: List[List[int]]) -> Optional[Dict[int, int]]:
+    """
+    Solve the negation links as XOR equations with a parity union-find.
+
+    See quick_unsat_check for the method.
+
+    Args:
+        negations: Negation links [i, j]
+
+    Returns:
+        Dictionary mapping every linked dial to its parity relative to the
+        root of its component (setting each root FALSE and every parity-1
+        dial TRUE satisfies all links), or None if the links contradict
+        each other
+    """
+    parent = {}
+    parity = {}  # Parity of a dial relative to its parent
+    size = {}
+
+    def find(dial: int) -> Tuple[int, int]:
+        """Return (root, parity of dial relative to root)."""
+        p = 0
+        while dial in parent:
+            p ^= parity[dial]
+            dial = parent[dial]
+        return dial, p
+
+    for dial_i, dial_j in negations:
+        root_i, p_i = find(dial_i)
+        root_j, p_j = find(dial_j)
+        if root_i == root_j:
+            if p_i == p_j:
+                return None  # The links force x_i == x_j
+            continue
+        # Union by size keeps the trees O(log n) deep
+        if size.get(root_i, 1) > size.get(root_j, 1):
+            root_i, root_j = root_j, root_i
+        parent[root_i] = root_j
+        parity[root_i] = p_i ^ p_j ^ 1
+        size[root_j] = size.get(root_j, 1) + size.get(root_i, 1)
+    return {dial: find(dial)[1] for pair in negations for dial in pair}
+
+
+# CNFs with at most this many clauses are decided by _solve_tiny in pure
+# Python, which is cheaper than creating and feeding a pysat solver
+TINY_CNF_LIMIT = 16
+
+# Most unsatisfiable residual formulas _solve_tiny remembers in one search;
+# bounds its memory on long (builtin-backend) searches
+TINY_FAILED_CACHE_SIZE = 1 << 16
+
+
+def _solve_tiny(cnf: List[List[int]]) -> Optional[int]:
+    """
+    Decide a small CNF with a pure-Python DPLL over bitmask assignments.
+
+    Each clause is held as a pair of bitmasks (bit v set = literal on variable
+    v) for its positive and negative literals, and a partial assignment as a
+    pair (true_mask, false_mask), so checking a clause is a few integer ANDs.
+    Unit clauses are propagated to a fixpoint before each branch. Each pass
+    keeps only the clauses still open, and a branch hands that list down, so
+    satisfied clauses are not rechecked deeper in the search.
+
+    Branches pick the free variable (among those in open clauses) that
+    occurs in the most clauses overall, trying first the polarity it takes
+    more often. This static order resolves the most constrained dials first.
+
+    Different partial assignments often leave the same residual formula (the
+    open clauses restricted to their free literals). Residuals proven
+    unsatisfiable are remembered, up to TINY_FAILED_CACHE_SIZE of them, and
+    the search backtracks as soon as it meets one again.
+
+    Args:
+        cnf: List of clauses over variables >= 1
+
+    Returns:
+        Bitmask of the variables set TRUE in a satisfying assignment (all
+        others FALSE), or None if the CNF is unsatisfiable
+    """
+    masks = []
+    for clause in cnf:
+        pos = neg = 0
+        for lit in clause:
+            if lit > 0:
+                pos |= 1 << lit
+            else:
+                neg |= 1 << -lit
+        masks.append((pos, neg))
+
+    # Decision order: (bit, try TRUE first) by descending occurrence count
+    occurrences = {}
+    for clause in cnf:
+        for lit in clause:
+            occurrences[lit] = occurrences.get(lit, 0) + 1
+    variables = sorted({abs(lit) for lit in occurrences},
+                       key=lambda var: -(occurrences.get(var, 0) + occurrences.get(-var, 0)))
+    order = [(1 << var, occurrences.get(var, 0) >= occurrences.get(-var, 0))
+             for var in variables]
+
+    failed = set()
+
+    def search(true_mask: int, false_mask: int,
+               clauses: List[Tuple[int, int]]) -> Optional[int]:
+        while True:
+            assigned = true_mask | false_mask
+            open_clauses = []
+            propagated = False
+            for clause in clauses:
+                pos, neg = clause
+                if pos & true_mask or neg & false_mask:
+                    continue  # Clause already satisfied
+                free_pos = pos & ~assigned
+                free_neg = neg & ~assigned
+                if not free_neg:
+                    if not free_pos:
+                        return None  # Clause falsified
+                    if not free_pos & (free_pos - 1):
+                        true_mask |= free_pos  # Unit: force the positive literal
+                        assigned |= free_pos
+                        propagated = True
+                        continue
+                elif not free_pos and not free_neg & (free_neg - 1):
+                    false_mask |= free_neg  # Unit: force the negative literal
+                    assigned |= free_neg
+                    propagated = True
+                    continue
+                open_clauses.append(clause)
+            clauses = open_clauses
+            if not propagated:
+                break
+
+        if not clauses:
+            return true_mask  # Every clause satisfied
+
+        # Until the first dead end there is nothing to look up, so searches
+        # that never backtrack never build a residual
+        free = ~assigned
+        residual = None
+        if failed:
+            residual = frozenset([(pos & free, neg & free) for pos, neg in clauses])
+            if residual in failed:
+                return None
+
+        # Branch on the first variable in decision order that an open
+        # clause still needs
+        live = 0
+        for pos, neg in clauses:
+            live |= pos | neg
+        live &= free
+        for bit, positive_first in order:
+            if bit & live:
+                break
+        if positive_first:
+            result = search(true_mask | bit, false_mask, clauses)
+            if result is None:
+                result = search(true_mask, false_mask | bit, clauses)
+        else:
+            result = search(true_mask, false_mask | bit, clauses)
+            if result is None:
+                result = search(true_mask | bit, false_mask, clauses)
+
+        if result is None and len(failed) < TINY_FAILED_CACHE_SIZE:
+            if residual is None:
+                residual = frozenset([(pos & free, neg & free) for pos, neg in clauses])
+            failed.add(residual)
+        return result
+
+    return search(0, 0, masks)
+
+
+class IncrementalLockSolver:
+    """
+    A SAT solver kept alive across many solve_lock calls.
+
+    Each instance's clauses are added behind a fresh activation literal and
+    solved under that assumption; afterwards the activation literal is fixed
+    to FALSE, which permanently satisfies (retires) that instance's clauses.
+    Activation literals are numbered above the largest dial count seen so far,
+    so dial i is always SAT variable i. If a later instance has more dials
+    than that, the underlying solver is replaced by a fresh one.
+    """
+
+    def __init__(self, backend: str = DEFAULT_BACKEND):
+        self.backend = backend
+        self.solver = None
+        self.max_dials = 0
+
+    def begin(self, num_dials: int) -> Tuple[Any, int]:
+        """
+        Prepare the solver for an instance with num_dials dials.
+
+        Returns:
+            Tuple of (solver, activation literal for this instance)
+        """
+        if self.solver is None or num_dials > self.max_dials:
+            self.delete()
+            self.solver = new_sat_solver(self.backend)
+            self.max_dials = num_dials
+        selector = max(self.solver.nof_vars(), self.max_dials) + 1
+        return self.solver, selector
+
+    def end(self, selector: int) -> None:
+        """Retire the clauses guarded by the given activation literal."""
+        self.solver.add_clause([-selector])
+
+    def delete(self) -> None:
+        """Free the underlying solver."""
+        if self.solver is not None:
+            self.solver.delete()
+            self.solver = None
+
+
+class SolutionCache:
+    """
+    On-disk store of solve_lock results, keyed by the instance's constraints.
+
+    The key is a digest of the dial count and the sorted negations and OR
+    clauses (binary pins do not change the CNF), so an instance that was
+    already solved - in this or an earlier run - is answered with one sqlite
+    lookup. Satisfiable instances store their dial values, unsatisfiable ones
+    NULL.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS solutions "
+                              "(key TEXT PRIMARY KEY, dial_values TEXT)")
+
+    @staticmethod
+    def key(instance: LockInstance) -> str:
+        """Return the digest identifying the instance's constraints."""
+        canonical = json.dumps([
+            instance.num_dials,
+            sorted(sorted(negation) for negation in instance.negations),
+            sorted(sorted(clause) for clause in instance.clauses),
+        ], separators=(',', ':'))
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Optional[LockSolution]]:
+        """
+        Look up a stored result.
+
+        Returns:
+            Tuple of (found, LockSolution or None if the instance is UNSAT)
+        """
+        row = self.conn.execute("SELECT dial_values FROM solutions WHERE key = ?",
+                                (key,)).fetchone()
+        if row is None:
+            return False, None
+        if row[0] is None:
+            return True, None
+        values = json.loads(row[0])
+        return True, LockSolution(dial_values=dict(enumerate(values, 1)))
+
+    def put(self, key: str, solution: Optional[LockSolution]) -> None:
+        """Store a result (None for an unsatisfiable instance)."""
+        values = None
+        if solution is not None:
+            dial_values = solution.dial_values
+            values = json.dumps([dial_values[dial] for dial in range(1, len(dial_values) + 1)])
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?)", (key, values))
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self.conn.close()
+
+
+def solve_lock(instance: LockInstance, verbose: bool = False,
+               solver: Optional[IncrementalLockSolver] = None,
+               backend: Optional[str] = None,
+               dedup: bool = True,
+               validated: bool = False,
+               cache: Optional[SolutionCache] = None) -> Tuple[Optional[LockSolution], SolveStats]:
     """
     Solve a lock instance using a SAT solver.
 
@@ -34,88 +420,178 @@ def solve_lock(instance: LockInstance, verbose: bool = False) -> Tuple[Optional[
     Args:
         instance: The lock instance to solve
         verbose: If True, print detailed solving statistics
+        solver: Optional IncrementalLockSolver to reuse instead of creating
+            (and deleting) a new SAT solver for this call
+        backend: Name of the SAT backend (a key of SAT_BACKENDS) to create,
+            or BUILTIN_BACKEND for the pure-Python search at any size;
+            ignored when solver is given, which carries its own backend.
+            By default, CNFs of at most TINY_CNF_LIMIT clauses are decided
+            in pure Python and larger ones with DEFAULT_BACKEND.
+        dedup: If True, repeated clauses (common in small core-based
+            instances) are dropped before solving
+        validated: If True, the caller guarantees the instance is valid
+            (e.g. it came from LockInstance.from_json / load_from_file or a
+            generator) and the O(clauses) validate() pass is skipped
+        cache: Optional SolutionCache to answer from, and to record this
+            result in when it is not there yet
 
     Returns:
-        Tuple of (LockSolution or None, stats_dict)
+        Tuple of (LockSolution or None, SolveStats)
         - LockSolution if satisfiable, None if unsatisfiable
-        - stats_dict contains: num_variables, num_clauses, solve_time, satisfiable
+
+    Raises:
+        ValueError: If the instance is invalid (only checked when not
+            validated), or the backend is unknown
     """
-    # Validate instance first
-    is_valid, error = instance.validate()
-    if not is_valid:
-        raise ValueError(f"Invalid lock instance: {error}")
+    # Reject a bad backend name even if no solver ends up being created
+    if backend is not None and backend != BUILTIN_BACKEND and backend not in SAT_BACKENDS:
+        raise ValueError(f"Unknown SAT backend: {backend} "
+                         f"(choose from {', '.join(SAT_BACKENDS)}, {BUILTIN_BACKEND})")
+
+    # Validate instance first, unless the caller already has
+    if not validated:
+        is_valid, error = instance.validate()
+        if not is_valid:
+            raise ValueError(f"Invalid lock instance: {error}")
 
     # Statistics tracking
-    stats = {
-        'num_variables': instance.num_dials,
-        'num_clauses': 0,
-        'solve_time': 0.0,
-        'satisfiable': False
-    }
-
-    # Create SAT solver
-    solver = Glucose3()
-
-    # Add negation constraints
-    # Not(i,j) means x_i ≠ x_j, which is (x_i ∨ x_j) ∧ (¬x_i ∨ ¬x_j)
-    for dial_i, dial_j in instance.negations:
-        # At least one must be true: x_i ∨ x_j
-        solver.add_clause([dial_i, dial_j])
-        stats['num_clauses'] += 1
-        # At least one must be false: ¬x_i ∨ ¬x_j
-        solver.add_clause([-dial_i, -dial_j])
-        stats['num_clauses'] += 1
-
-    # Add OR clause constraints
-    # OR(i,j,k) means at least one must be TRUE: x_i ∨ x_j ∨ x_k
-    for clause in instance.clauses:
-        solver.add_clause(clause)
-        stats['num_clauses'] += 1
+    stats = SolveStats(num_variables=instance.num_dials)
+
+    # A cached result needs no CNF and no search
+    if cache is not None:
+        start_time = time.perf_counter()
+        cache_key = SolutionCache.key(instance)
+        found, solution = cache.get(cache_key)
+        if found:
+            stats.solve_time = time.perf_counter() - start_time
+            stats.satisfiable = solution is not None
+            stats.cache_hit = True
+            if verbose:
+                print("Result found in solution cache")
+                print()
+            return solution, stats
+
+    # Instances missing a constraint family, and contradictory negation
+    # links, need no CNF and no SAT search
+    start_time = time.perf_counter()
+    shortcut = None
+    if not instance.clauses:
+        # Only XOR links: 2-color each component, roots FALSE
+        parities = _negation_parities(instance.negations)
+        if parities is None:
+            shortcut = "Negation links contradict each other: UNSAT without SAT search"
+            solution = None
+        else:
+            shortcut = "No OR clauses: negation links 2-colored without SAT search"
+            solution = LockSolution(dial_values={
+                dial: 6 if parities.get(dial) else 1
+                for dial in range(1, instance.num_dials + 1)
+            })
+    elif not instance.negations:
+        # OR clauses are positive: all dials TRUE (6) gives every sum 18
+        shortcut = "No negation links: all dials TRUE satisfies every clause"
+        solution = LockSolution(dial_values=dict.fromkeys(range(1, instance.num_dials + 1), 6))
+    elif quick_unsat_check(instance):
+        shortcut = "Negation links contradict each other: UNSAT without SAT search"
+        solution = None
+    if shortcut is not None:
+        stats.solve_time = time.perf_counter() - start_time
+        stats.num_clauses = len(instance.negations) * 2 + len(instance.clauses)
+        stats.satisfiable = solution is not None
+        if verbose:
+            print(shortcut)
+            print()
+        if cache is not None:
+            cache.put(cache_key, solution)
+        return solution, stats
+
+    # Negations become two binary clauses each, OR clauses one clause each
+    # (see LockInstance.to_cnf for the encoding). Nothing below modifies a
+    # clause, so the OR clauses are shared rather than copied
+    cnf = instance.to_cnf(copy=False)
+    if dedup:
+        unique = _dedup_clauses(cnf)
+        stats.duplicates_removed = len(cnf) - len(unique)
+        cnf = unique
+    stats.num_clauses = len(cnf)
+
+    # Tiny CNFs skip the SAT solver; otherwise create one, or reuse the
+    # caller's behind an activation literal
+    incremental = solver
+    tiny = incremental is None and (
+        backend == BUILTIN_BACKEND or (backend is None and len(cnf) <= TINY_CNF_LIMIT))
+    if tiny:
+        solver = None
+    elif incremental is None:
+        solver = new_sat_solver(backend or DEFAULT_BACKEND)
+        solver.append_formula(cnf)
+        assumptions = []
+    else:
+        solver, selector = incremental.begin(instance.num_dials)
+        solver.append_formula([clause + [-selector] for clause in cnf])
+        assumptions = [selector]
 
     if verbose:
         print(f"SAT Encoding:")
-        print(f"  Variables: {stats['num_variables']}")
-        print(f"  Clauses: {stats['num_clauses']}")
+        print(f"  Variables: {stats.num_variables}")
+        print(f"  Clauses: {stats.num_clauses}")
         print(f"    - From negations: {len(instance.negations) * 2}")
         print(f"    - From OR clauses: {len(instance.clauses)}")
+        print(f"    - Duplicates removed: {stats.duplicates_removed}")
         print()
 
-    # Solve the SAT problem with timing
-    start_time = time.time()
-    result = solver.solve()
-    end_time = time.time()
-    stats['solve_time'] = end_time - start_time
-    stats['satisfiable'] = result
+    # Solve the SAT problem with timing (perf_counter is monotonic and high
+    # resolution; time.time() can round fast solves down to 0)
+    start_time = time.perf_counter()
+    if tiny:
+        true_mask = _solve_tiny(cnf)
+        result = true_mask is not None
+    else:
+        result = solver.solve(assumptions=assumptions)
+    stats.solve_time = time.perf_counter() - start_time
+    stats.satisfiable = result
 
     if verbose:
-        print(f"Solving time: {stats['solve_time']:.4f} seconds")
+        print(f"Solving time: {stats.solve_time:.4f} seconds")
         print()
 
-    if result:
-        # Extract solution
+    if result and tiny:
+        # Bit i of the assignment mask is dial i's value
+        solution = LockSolution(dial_values={
+            dial: 6 if true_mask >> dial & 1 else 1
+            for dial in range(1, instance.num_dials + 1)
+        })
+    elif result:
+        # Extract solution: the model holds one literal (+v TRUE → dial = 6,
+        # -v FALSE → dial = 1) per variable the solver knows, in one pass.
+        # Activation literals of a reused solver lie above num_dials.
         model = solver.get_model()
-
-        # Convert SAT model to dial values
-        # model contains assignments for variables 1 to num_dials
+        num_dials = instance.num_dials
         dial_values = {}
-        for dial in range(1, instance.num_dials + 1):
-            # Find the assignment for this dial
-            if dial in model:
-                # Variable is TRUE → dial = 6
-                dial_values[dial] = 6
-            elif -dial in model:
-                # Variable is FALSE → dial = 1
-                dial_values[dial] = 1
-            else:
-                # Variable is unassigned (can be either)
-                # Default to FALSE (dial = 1)
-                dial_values[dial] = 1
-
-        solver.delete()
-        return LockSolution(dial_values=dial_values), stats
+        for lit in model:
+            if lit > 0:
+                if lit <= num_dials:
+                    dial_values[lit] = 6
+            elif -lit <= num_dials:
+                dial_values[-lit] = 1
+
+        # Dials in no clause may be unknown to the solver (either value
+        # works); default them to FALSE (dial = 1)
+        if len(dial_values) < num_dials:
+            for dial in range(1, num_dials + 1):
+                dial_values.setdefault(dial, 1)
+
+        solution = LockSolution(dial_values=dial_values)
     else:
+        solution = None
+
+    if incremental is not None:
+        incremental.end(selector)
+    elif solver is not None:
         solver.delete()
-        return None, stats
+    if cache is not None:
+        cache.put(cache_key, solution)
+    return solution, stats
 
 
 def main():
@@ -125,6 +601,14 @@ def main():
     parser = argparse.ArgumentParser(description='Solve lock instances using SAT solver')
     parser.add_argument('instance_file', help='Path to lock instance JSON file')
     parser.add_argument('-v', '--verbose', action='store_true', help='Show detailed solving statistics')
+    parser.add_argument('--backend', choices=sorted(SAT_BACKENDS) + [BUILTIN_BACKEND],
+                        default=None,
+                        help=f'SAT solver backend (default: {DEFAULT_BACKEND}, or a built-in '
+                             f'search for instances of at most {TINY_CNF_LIMIT} clauses; '
+                             f'{BUILTIN_BACKEND} forces the built-in search)')
+    parser.add_argument('--cache', metavar='PATH', default=None,
+                        help='SQLite file of previous results; the instance is looked up '
+                             'there first and the result recorded (created if missing)')
 
     args = parser.parse_args()
 
@@ -141,7 +625,14 @@ def main():
         print("Solving...")
         if args.verbose:
             print()
-        solution, stats = solve_lock(instance, verbose=args.verbose)
+        # load_from_file validated the instance
+        cache = SolutionCache(args.cache) if args.cache else None
+        try:
+            solution, stats = solve_lock(instance, verbose=args.verbose, backend=args.backend,
+                                         validated=True, cache=cache)
+        finally:
+            if cache is not None:
+                cache.close()
 
         if solution:
             print("✓ SATISFIABLE - Solution found!")
@@ -149,9 +640,9 @@ def main():
 
             if args.verbose:
                 print(f"Statistics:")
-                print(f"  Variables: {stats['num_variables']}")
-                print(f"  Clauses: {stats['num_clauses']}")
-                print(f"  Solve time: {stats['solve_time']:.6f} seconds")
+                print(f"  Variables: {stats.num_variables}")
+                print(f"  Clauses: {stats.num_clauses}")
+                print(f"  Solve time: {stats.solve_time:.6f} seconds")
                 print()
 
             print("Dial settings:")
@@ -169,8 +660,7 @@ def main():
                 # Ask to save
                 save = input("\nSave solution to file? (yes/no): ").strip().lower()
                 if save in ['yes', 'y']:
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    timestamp = time.strftime("%Y%m%d_%H%M%S")
                     output_file = f"examples/solutions/lock_solution_{timestamp}.json"
                     solution.save_to_file(output_file)
                     print(f"✓ Solution saved to: {output_file}")
@@ -187,9 +677,9 @@ def main():
             if args.verbose:
                 print()
                 print(f"Statistics:")
-                print(f"  Variables: {stats['num_variables']}")
-                print(f"  Clauses: {stats['num_clauses']}")
-                print(f"  Solve time: {stats['solve_time']:.6f} seconds")
+                print(f"  Variables: {stats.num_variables}")
+                print(f"  Clauses: {stats.num_clauses}")
+                print(f"  Solve time: {stats.solve_time:.6f} seconds")
 
             sys.exit(1)
 
@@ -4,12 +4,123 @@ Core data structures for the lock-and-SAT system.
 This module defines the fundamental types used to represent lock instances and solutions.
 """
 
+import hashlib
 import json
-from typing import Dict, List, Tuple, Any
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass, field
 
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Clauses are encoded and written this many at a time when saving an
+# instance, so a large instance never exists as one serialized blob
+SAVE_CHUNK_CLAUSES = 4096
+
+# Parsed and validated instances kept by LockInstance.load_from_file(cache=True),
+# keyed by a digest of the file contents (least recently used dropped first).
+# The cache holds at most LOAD_CACHE_SIZE instances and LOAD_CACHE_MAX_CONSTRAINTS
+# pins, negations and clauses in total, so large instances cannot pile up
+LOAD_CACHE_SIZE = 128
+LOAD_CACHE_MAX_CONSTRAINTS = 1_000_000
+_LOAD_CACHE: 'OrderedDict[bytes, Tuple[LockInstance, int]]' = OrderedDict()
+_load_cache_constraints = 0
+
+
+def _dumps(data: Any, int_keys: bool = False) -> bytes:
+    """
+    Encode data as JSON with 2-space indentation.
+
+    Uses orjson when it is installed (same output, encoded in C) and falls
+    back to the standard library otherwise. With int_keys, dictionaries may
+    have integer keys, which are written as strings as json.dumps does.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2
+        if int_keys:
+            option |= orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    Decode a JSON document read from a file.
+
+    Uses orjson when it is installed (parsed in C, several times faster on
+    large instances) and falls back to the standard library otherwise.
+    Either way, malformed input raises a json.JSONDecodeError (ValueError).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_rows(rows: Sequence[Sequence[int]]) -> bytes:
+    """
+    Encode a list of integer lists like _dumps, for the clause chunks.
+
+    Without orjson, json.dumps(indent=2) runs the pure-Python encoder, so
+    this shape is rendered with str.join instead (same bytes). Entries that
+    are not integers fall back to _dumps.
+    """
+    if orjson is not None or not rows:
+        return _dumps(rows)
+    try:
+        items = ["[\n    " + ",\n    ".join(map(int.__repr__, row)) + "\n  ]" if row else "[]"
+                 for row in rows]
+    except TypeError:
+        return _dumps(rows)
+    return ("[\n  " + ",\n  ".join(items) + "\n]").encode()
+
+
+def _write_json(filename: str, data: Dict[str, Any], int_keys: bool = False) -> None:
+    """Write a JSON-serializable dictionary to a file with 2-space indentation."""
+    with open(filename, 'wb') as f:
+        f.write(_dumps(data, int_keys))
+
+
+def _write_json_streaming(filename: str, data: Dict[str, Any], key: str,
+                          items: Sequence[Sequence[int]]) -> None:
+    """
+    Write data (non-empty) plus a trailing list under `key`, encoding the list in chunks.
+
+    The output is byte-identical to _write_json(filename, {**data, key: items})
+    but only SAVE_CHUNK_CLAUSES items are serialized at a time: each chunk is
+    encoded as a top-level list and re-indented to the nesting depth it has
+    inside the document.
+    """
+    with open(filename, 'wb') as f:
+        # Everything before the list: the encoded head minus its closing "\n}"
+        f.write(_dumps(data)[:-2] + b',\n  ' + _dumps(key) + b': ')
+        if not items:
+            f.write(b'[]\n}')
+            return
+
+        f.write(b'[\n')
+        for start in range(0, len(items), SAVE_CHUNK_CLAUSES):
+            if start:
+                f.write(b',\n')
+            # "[\n  item,\n  item\n]" -> "    item,\n    item" one level deeper
+            body = _dumps_rows(items[start:start + SAVE_CHUNK_CLAUSES])[2:-2]
+            f.write(b'  ' + body.replace(b'\n', b'\n  '))
+        f.write(b'\n  ]\n}')
+
+
+# Solution files written by LockSolution: version 2 stores dial values as a
+# list by position; version 1 (no version field) as a map keyed by dial
+SOLUTION_FORMAT_VERSION = 2
+
+# Options for the dataclasses of this package (lock_solver uses them too):
+# slotted (no per-instance __dict__) where supported, i.e. on Python 3.10+
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class LockInstance:
     """
     Represents a lock configuration that encodes a SAT problem.
@@ -19,15 +130,27 @@ class LockInstance:
 
     Attributes:
         num_dials: Total number of dials in the lock
-        binary_pins: List of dial indices that must be binary (restricted to positions 1 or 6)
+        binary_pins: Dial indices that must be binary (restricted to positions 1 or 6);
+            a list, or a range such as range(1, num_dials + 1) for "all dials"
         negations: List of negation links [i, j] where dial_i + dial_j = 7
         clauses: List of OR clauses [i, j, k] where dial_i + dial_j + dial_k >= 8
     """
     num_dials: int
-    binary_pins: List[int] = field(default_factory=list)
+    binary_pins: Sequence[int] = field(default_factory=list)
     negations: List[List[int]] = field(default_factory=list)
     clauses: List[List[int]] = field(default_factory=list)
 
+    def __eq__(self, other: object) -> bool:
+        # binary_pins compares by content, so a generated instance (pins as
+        # a range) equals its saved and reloaded copy (pins as a list)
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        pins, other_pins = self.binary_pins, other.binary_pins
+        if pins.__class__ is not other_pins.__class__:
+            pins, other_pins = list(pins), list(other_pins)
+        return (self.num_dials == other.num_dials and pins == other_pins
+                and self.negations == other.negations and self.clauses == other.clauses)
+
     def validate(self) -> Tuple[bool, str]:
         """
         Validate the lock instance for correctness.
@@ -38,14 +161,19 @@ class LockInstance:
         if self.num_dials < 1:
             return False, "Number of dials must be at least 1"
 
-        # Validate binary pins
-        for dial in self.binary_pins:
-            if dial < 1 or dial > self.num_dials:
-                return False, f"Binary pin dial {dial} is out of range [1, {self.num_dials}]"
+        # Validate binary pins. A range has distinct dials by construction,
+        # so one within [1, num_dials] (checked from its ends) is valid.
+        pins = self.binary_pins
+        if not (isinstance(pins, range) and
+                (not pins or (min(pins[0], pins[-1]) >= 1 and
+                              max(pins[0], pins[-1]) <= self.num_dials))):
+            for dial in pins:
+                if dial < 1 or dial > self.num_dials:
+                    return False, f"Binary pin dial {dial} is out of range [1, {self.num_dials}]"
 
-        # Check for duplicate binary pins
-        if len(self.binary_pins) != len(set(self.binary_pins)):
-            return False, "Duplicate binary pins detected"
+            # Check for duplicate binary pins
+            if len(pins) != len(set(pins)):
+                return False, "Duplicate binary pins detected"
 
         # Validate negations
         for negation in self.negations:
@@ -79,11 +207,42 @@ class LockInstance:
             if dial_k < 1 or dial_k > self.num_dials:
                 return False, f"Clause dial {dial_k} is out of range [1, {self.num_dials}]"
 
-            if len(set(clause)) != 3:
+            if dial_i == dial_j or dial_i == dial_k or dial_j == dial_k:
                 return False, f"Clause dials must be distinct, got {clause}"
 
         return True, ""
 
+    def to_cnf(self, copy: bool = True) -> List[List[int]]:
+        """
+        Encode the lock constraints as CNF clauses over the dial variables.
+
+        SAT variable i is dial i (TRUE = position 6, FALSE = position 1).
+        Each negation [i, j] becomes (x_i ∨ x_j) ∧ (¬x_i ∨ ¬x_j) and each OR
+        clause [i, j, k] becomes (x_i ∨ x_j ∨ x_k). Binary pins need no
+        clauses since SAT variables are already two-valued.
+
+        Every literal of a clause has the same sign and validate() requires
+        distinct dials, so no clause is a tautology (x ∨ ¬x) and none needs
+        filtering before it is handed to a solver.
+
+        Args:
+            copy: Copy the OR clauses. Pass False when the CNF is only read
+                (e.g. handed straight to a SAT solver, which copies clauses
+                itself); the OR clauses are then this instance's own lists
+                and must not be modified.
+
+        Returns:
+            List of clauses (negation clauses first, then OR clauses)
+        """
+        cnf = []
+        append = cnf.append
+        for dial_i, dial_j in self.negations:
+            append([dial_i, dial_j])
+            append([-dial_i, -dial_j])
+        # Copy OR clauses straight into cnf, without an intermediate list
+        cnf.extend(map(list, self.clauses) if copy else self.clauses)
+        return cnf
+
     def to_json(self) -> Dict[str, Any]:
         """
         Convert the lock instance to a JSON-serializable dictionary.
@@ -93,7 +252,8 @@ class LockInstance:
         """
         return {
             "num_dials": self.num_dials,
-            "binary_pins": self.binary_pins,
+            "binary_pins": self.binary_pins if isinstance(self.binary_pins, list)
+                           else list(self.binary_pins),
             "negations": self.negations,
             "clauses": self.clauses
         }
@@ -132,26 +292,66 @@ class LockInstance:
         """
         Save the lock instance to a JSON file.
 
+        The clause list, which dominates large instances, is encoded and
+        written in chunks rather than as part of one in-memory document.
+
         Args:
             filename: Path to the output file
         """
-        with open(filename, 'w') as f:
-            json.dump(self.to_json(), f, indent=2)
+        data = self.to_json()
+        clauses = data.pop("clauses")
+        _write_json_streaming(filename, data, "clauses", clauses)
 
     @classmethod
-    def load_from_file(cls, filename: str) -> 'LockInstance':
+    def load_from_file(cls, filename: str, cache: bool = False) -> 'LockInstance':
         """
         Load a lock instance from a JSON file.
 
+        With cache, files whose contents were already loaded are not parsed
+        and validated again: the instance is copied from an in-memory cache
+        (keyed by a digest of the contents, so a rewritten file is always
+        reparsed). This pays off for long-lived callers that load the same
+        files repeatedly; one-shot loads should leave it off, as the cache
+        keeps a second copy of every instance. Every call returns a new,
+        independent instance.
+
         Args:
             filename: Path to the input file
+            cache: If True, use (and fill) the in-memory load cache
 
         Returns:
             LockInstance object
         """
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        return cls.from_json(data)
+        global _load_cache_constraints
+
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        if not cache:
+            return cls.from_json(_loads(raw))
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+
+        entry = _LOAD_CACHE.get(key)
+        if entry is None:
+            cached = cls.from_json(_loads(raw))
+            size = len(cached.binary_pins) + len(cached.negations) + len(cached.clauses)
+            if size <= LOAD_CACHE_MAX_CONSTRAINTS:
+                _LOAD_CACHE[key] = (cached, size)
+                _load_cache_constraints += size
+                while (len(_LOAD_CACHE) > LOAD_CACHE_SIZE
+                       or _load_cache_constraints > LOAD_CACHE_MAX_CONSTRAINTS):
+                    _load_cache_constraints -= _LOAD_CACHE.popitem(last=False)[1][1]
+            else:
+                return cached  # Too large to keep; nobody else holds it
+        else:
+            cached = entry[0]
+            _LOAD_CACHE.move_to_end(key)
+
+        return cls(
+            num_dials=cached.num_dials,
+            binary_pins=list(cached.binary_pins),
+            negations=[negation[:] for negation in cached.negations],
+            clauses=[clause[:] for clause in cached.clauses]
+        )
 
     def __str__(self) -> str:
         """Return a human-readable string representation."""
@@ -165,7 +365,7 @@ class LockInstance:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LockSolution:
     """
     Represents a solution to a lock instance (dial settings).
@@ -175,6 +375,25 @@ class LockSolution:
     """
     dial_values: Dict[int, int] = field(default_factory=dict)
 
+    def as_array(self, num_dials: int) -> List[Optional[int]]:
+        """
+        Return the dial values as a dense list indexed by dial number.
+
+        Constraint checks index this list instead of hashing into
+        dial_values for every literal. It is built in one C-level pass and
+        is a fresh list on every call, so later changes to dial_values are
+        never missed.
+
+        Args:
+            num_dials: Number of dials of the instance being checked
+
+        Returns:
+            List of length num_dials + 1 whose entry d is the value of dial d;
+            entry 0 and dials missing from dial_values are None, and dials
+            outside [1, num_dials] are left out
+        """
+        return list(map(self.dial_values.get, range(num_dials + 1)))
+
     def validate(self, instance: LockInstance) -> Tuple[bool, str]:
         """
         Validate that this solution is compatible with the given lock instance.
@@ -185,54 +404,77 @@ class LockSolution:
         Returns:
             Tuple of (is_valid, error_message). If valid, error_message is empty.
         """
-        # Check that all dials are set
-        for dial in range(1, instance.num_dials + 1):
-            if dial not in self.dial_values:
-                return False, f"Dial {dial} is not set"
-
-        # Check for extra dials
-        for dial in self.dial_values:
-            if dial < 1 or dial > instance.num_dials:
-                return False, f"Dial {dial} is out of range [1, {instance.num_dials}]"
+        # Keys are distinct, so num_dials keys within [1, num_dials] (checked
+        # by min()/max() in C) set every dial; only otherwise look for the
+        # first missing or out-of-range dial
+        dial_values = self.dial_values
+        if len(dial_values) != instance.num_dials or (
+                dial_values and (min(dial_values) < 1 or max(dial_values) > instance.num_dials)):
+            # Check that all dials are set
+            for dial in range(1, instance.num_dials + 1):
+                if dial not in dial_values:
+                    return False, f"Dial {dial} is not set"
+
+            # Check for extra dials
+            for dial in dial_values:
+                if dial < 1 or dial > instance.num_dials:
+                    return False, f"Dial {dial} is out of range [1, {instance.num_dials}]"
+
+        # Every dial is set, so the dense values hold no None
+        vals = self.as_array(instance.num_dials)
 
         # Validate binary pins
         for dial in instance.binary_pins:
-            value = self.dial_values[dial]
-            if value not in [1, 6]:
+            value = vals[dial]
+            if value != 1 and value != 6:
                 return False, f"Binary pin dial {dial} must be 1 or 6, got {value}"
 
         # Validate negations
         for dial_i, dial_j in instance.negations:
-            sum_val = self.dial_values[dial_i] + self.dial_values[dial_j]
+            sum_val = vals[dial_i] + vals[dial_j]
             if sum_val != 7:
                 return False, (
                     f"Negation link between dials {dial_i} and {dial_j} violated: "
-                    f"{self.dial_values[dial_i]} + {self.dial_values[dial_j]} = {sum_val} (expected 7)"
+                    f"{vals[dial_i]} + {vals[dial_j]} = {sum_val} (expected 7)"
                 )
 
         # Validate OR clauses
         for dial_i, dial_j, dial_k in instance.clauses:
-            sum_val = (
-                self.dial_values[dial_i] +
-                self.dial_values[dial_j] +
-                self.dial_values[dial_k]
-            )
+            sum_val = vals[dial_i] + vals[dial_j] + vals[dial_k]
             if sum_val < 8:
                 return False, (
                     f"OR clause for dials ({dial_i}, {dial_j}, {dial_k}) violated: "
-                    f"{self.dial_values[dial_i]} + {self.dial_values[dial_j]} + "
-                    f"{self.dial_values[dial_k]} = {sum_val} (expected >= 8)"
+                    f"{vals[dial_i]} + {vals[dial_j]} + "
+                    f"{vals[dial_k]} = {sum_val} (expected >= 8)"
                 )
 
         return True, ""
 
+    def _compact_values(self) -> Optional[List[int]]:
+        """
+        Return the dial values as a list by position (dial 1 first), if the
+        dials are exactly 1..N; otherwise None.
+        """
+        values = self.dial_values
+        if values and min(values) == 1 and max(values) == len(values):
+            return list(map(values.__getitem__, range(1, len(values) + 1)))
+        return None
+
     def to_json(self) -> Dict[str, Any]:
         """
         Convert the solution to a JSON-serializable dictionary.
 
+        A solution setting exactly dials 1..N (every complete solution) is
+        written in the compact version 2 form, a list of values by position,
+        which needs no string key per dial. Any other dial set falls back to
+        the version 1 form, a map from dial index (as a string) to value.
+
         Returns:
             Dictionary representation of the solution
         """
+        compact = self._compact_values()
+        if compact is not None:
+            return {"version": SOLUTION_FORMAT_VERSION, "dial_values": compact}
         return {
             "dial_values": {str(k): v for k, v in self.dial_values.items()}
         }
@@ -242,6 +484,9 @@ class LockSolution:
         """
         Create a LockSolution from a JSON dictionary.
 
+        Accepts both file formats: a list of values by position (version 2)
+        and a map from dial index to value (version 1, no version field).
+
         Args:
             data: Dictionary containing solution data
 
@@ -249,10 +494,16 @@ class LockSolution:
             New LockSolution object
 
         Raises:
-            ValueError: If the data is invalid
+            ValueError: If the data is invalid or of an unknown version
         """
+        version = data.get("version", 1)
+        if version not in (1, SOLUTION_FORMAT_VERSION):
+            raise ValueError(f"Unsupported solution format version: {version}")
         try:
-            dial_values = {int(k): v for k, v in data["dial_values"].items()}
+            dial_values = data["dial_values"]
+            if isinstance(dial_values, list):
+                return cls(dial_values=dict(enumerate(dial_values, 1)))
+            dial_values = {int(k): v for k, v in dial_values.items()}
             return cls(dial_values=dial_values)
         except KeyError as e:
             raise ValueError(f"Missing required field: {e}")
@@ -261,13 +512,19 @@ class LockSolution:
 
     def save_to_file(self, filename: str) -> None:
         """
-        Save the solution to a JSON file.
+        Save the solution to a JSON file, in the format to_json() describes.
+
+        A version 1 dial map is encoded with its integer keys as they are,
+        without building the string-keyed copy that to_json() returns.
 
         Args:
             filename: Path to the output file
         """
-        with open(filename, 'w') as f:
-            json.dump(self.to_json(), f, indent=2)
+        compact = self._compact_values()
+        if compact is not None:
+            _write_json(filename, {"version": SOLUTION_FORMAT_VERSION, "dial_values": compact})
+        else:
+            _write_json(filename, {"dial_values": self.dial_values}, int_keys=True)
 
     @classmethod
     def load_from_file(cls, filename: str) -> 'LockSolution':
@@ -280,8 +537,8 @@ class LockSolution:
         Returns:
             LockSolution object
         """
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            data = _loads(f.read())
         return cls.from_json(data)
 
     def __str__(self) -> str:
@@ -7,10 +7,65 @@ of a lock instance.
 """
 
 import sys
-from typing import Tuple, List
+from typing import Iterable, List, Tuple
 from lock_types import LockInstance, LockSolution
 
 
+def _check_coverage(instance: LockInstance, solution: LockSolution
+                    ) -> Tuple[List[int], List[int]]:
+    """
+    Find the dials a solution leaves unset and the ones it sets out of range.
+
+    Args:
+        instance: The lock instance
+        solution: The proposed solution
+
+    Returns:
+        Tuple of (missing dials in ascending order, out-of-range dials)
+    """
+    dial_values = solution.dial_values
+    num_dials = instance.num_dials
+
+    # min()/max() over the keys run in C; only scan them if one is off
+    extra_dials = []
+    if dial_values and (min(dial_values) < 1 or max(dial_values) > num_dials):
+        extra_dials = [dial for dial in dial_values if dial < 1 or dial > num_dials]
+
+    # Keys are distinct, so num_dials in-range keys cover every dial
+    missing_dials = []
+    if len(dial_values) - len(extra_dials) != num_dials:
+        missing_dials = sorted(set(range(1, num_dials + 1)).difference(dial_values))
+
+    return missing_dials, extra_dials
+
+
+def _find_violations(instance: LockInstance, values: List[int]
+                     ) -> Tuple[List[int], List[Tuple[int, int]], List[Tuple[int, int, int]]]:
+    """
+    Scan every constraint once and collect the violated ones.
+
+    Each constraint kind is checked by a single comprehension, which runs
+    the scan in one frame without the per-constraint appends and locals of
+    an explicit loop. Only violations are materialized, so the lists are
+    empty for a valid solution.
+
+    Args:
+        instance: The lock instance
+        values: Dense dial values (see LockSolution.as_array); every dial set
+
+    Returns:
+        Tuple of (violated binary pin dials, violated negation pairs,
+        violated clause triples), each in instance order
+    """
+    binary_failures = [dial for dial in instance.binary_pins
+                       if values[dial] != 1 and values[dial] != 6]
+    negation_failures = [(dial_i, dial_j) for dial_i, dial_j in instance.negations
+                         if values[dial_i] + values[dial_j] != 7]
+    clause_failures = [(dial_i, dial_j, dial_k) for dial_i, dial_j, dial_k in instance.clauses
+                       if values[dial_i] + values[dial_j] + values[dial_k] < 8]
+    return binary_failures, negation_failures, clause_failures
+
+
 def verify_solution(instance: LockInstance, solution: LockSolution) -> Tuple[bool, List[str]]:
     """
     Verify a solution against a lock instance and return detailed results.
@@ -26,13 +81,9 @@ def verify_solution(instance: LockInstance, solution: LockSolution) -> Tuple[boo
     """
     messages = []
     all_valid = True
+    missing_dials, extra_dials = _check_coverage(instance, solution)
 
     # Check dial coverage
-    missing_dials = []
-    for dial in range(1, instance.num_dials + 1):
-        if dial not in solution.dial_values:
-            missing_dials.append(dial)
-
     if missing_dials:
         messages.append(f"✗ Dial coverage: FAILED - Missing dials: {missing_dials}")
         all_valid = False
@@ -40,11 +91,6 @@ def verify_solution(instance: LockInstance, solution: LockSolution) -> Tuple[boo
         messages.append(f"✓ Dial coverage: PASSED - All {instance.num_dials} dials are set")
 
     # Check for extra dials
-    extra_dials = []
-    for dial in solution.dial_values:
-        if dial < 1 or dial > instance.num_dials:
-            extra_dials.append(dial)
-
     if extra_dials:
         messages.append(f"✗ Extra dials: FAILED - Out of range dials: {extra_dials}")
         all_valid = False
@@ -55,52 +101,42 @@ def verify_solution(instance: LockInstance, solution: LockSolution) -> Tuple[boo
     if not all_valid:
         return False, messages
 
+    # Every dial is set: index a dense value list instead of the dict
+    values = solution.as_array(instance.num_dials)
+    binary_failures, negation_failures, clause_failures = _find_violations(instance, values)
+
     # Check binary pins
-    binary_failures = []
-    for dial in instance.binary_pins:
-        value = solution.dial_values[dial]
-        if value not in [1, 6]:
-            binary_failures.append((dial, value))
-            messages.append(f"✗ Binary pin on dial {dial}: FAILED (value={value}, expected 1 or 6)")
-            all_valid = False
+    for dial in binary_failures:
+        messages.append(f"✗ Binary pin on dial {dial}: FAILED (value={values[dial]}, expected 1 or 6)")
 
     if not binary_failures:
         messages.append(f"✓ Binary pins: PASSED - All {len(instance.binary_pins)} binary pins satisfied")
 
     # Check negation links
-    negation_failures = 0
-    for dial_i, dial_j in instance.negations:
-        val_i = solution.dial_values[dial_i]
-        val_j = solution.dial_values[dial_j]
-        sum_val = val_i + val_j
-
-        if sum_val != 7:
-            messages.append(f"✗ Not({dial_i}, {dial_j}): FAILED (sum={sum_val}, expected 7)")
-            negation_failures += 1
-            all_valid = False
-
-    if negation_failures == 0:
+    for dial_i, dial_j in negation_failures:
+        sum_val = values[dial_i] + values[dial_j]
+        messages.append(f"✗ Not({dial_i}, {dial_j}): FAILED (sum={sum_val}, expected 7)")
+
+    if not negation_failures:
         messages.append(f"✓ Negation links: PASSED - All {len(instance.negations)} links satisfied")
 
     # Check OR clauses
-    clause_failures = 0
-    for dial_i, dial_j, dial_k in instance.clauses:
-        val_i = solution.dial_values[dial_i]
-        val_j = solution.dial_values[dial_j]
-        val_k = solution.dial_values[dial_k]
-        sum_val = val_i + val_j + val_k
-
-        if sum_val < 8:
-            messages.append(f"✗ Clause ({dial_i},{dial_j},{dial_k}): FAILED (sum={sum_val}, expected >= 8)")
-            clause_failures += 1
-            all_valid = False
-
-    if clause_failures == 0:
+    for dial_i, dial_j, dial_k in clause_failures:
+        sum_val = values[dial_i] + values[dial_j] + values[dial_k]
+        messages.append(f"✗ Clause ({dial_i},{dial_j},{dial_k}): FAILED (sum={sum_val}, expected >= 8)")
+
+    if not clause_failures:
         messages.append(f"✓ OR clauses: PASSED - All {len(instance.clauses)} clauses satisfied")
 
+    all_valid = not (binary_failures or negation_failures or clause_failures)
     return all_valid, messages
 
 
+def _write_lines(lines: Iterable[str]) -> None:
+    """Write report lines to stdout in one call instead of a print() per line."""
+    sys.stdout.write("".join(line + "\n" for line in lines))
+
+
 def verify_solution_detailed(instance: LockInstance, solution: LockSolution) -> bool:
     """
     Verify a solution against a lock instance with detailed output.
@@ -118,14 +154,10 @@ def verify_solution_detailed(instance: LockInstance, solution: LockSolution) ->
     print()
 
     all_valid = True
+    missing_dials, extra_dials = _check_coverage(instance, solution)
 
     # Check dial coverage
     print("1. Checking dial coverage...")
-    missing_dials = []
-    for dial in range(1, instance.num_dials + 1):
-        if dial not in solution.dial_values:
-            missing_dials.append(dial)
-
     if missing_dials:
         print(f"   ✗ FAILED: Missing dials: {missing_dials}")
         all_valid = False
@@ -135,11 +167,6 @@ def verify_solution_detailed(instance: LockInstance, solution: LockSolution) ->
 
     # Check for extra dials
     print("2. Checking for extra dials...")
-    extra_dials = []
-    for dial in solution.dial_values:
-        if dial < 1 or dial > instance.num_dials:
-            extra_dials.append(dial)
-
     if extra_dials:
         print(f"   ✗ FAILED: Extra dials out of range: {extra_dials}")
         all_valid = False
@@ -154,18 +181,16 @@ def verify_solution_detailed(instance: LockInstance, solution: LockSolution) ->
         print("=" * 60)
         return False
 
+    # Every dial is set: index a dense value list instead of the dict
+    values = solution.as_array(instance.num_dials)
+    binary_failures, negation_failures, clause_failures = _find_violations(instance, values)
+
     # Check binary pins
     print("3. Checking binary pin constraints...")
-    binary_failures = []
-    for dial in instance.binary_pins:
-        value = solution.dial_values[dial]
-        if value not in [1, 6]:
-            binary_failures.append((dial, value))
-
     if binary_failures:
         print(f"   ✗ FAILED: {len(binary_failures)} violations")
-        for dial, value in binary_failures:
-            print(f"      Dial {dial}: value={value} (expected 1 or 6)")
+        _write_lines("      Dial %d: value=%s (expected 1 or 6)" % (dial, values[dial])
+                     for dial in binary_failures)
         all_valid = False
     else:
         print(f"   ✓ PASSED: All {len(instance.binary_pins)} binary pins satisfied")
@@ -173,19 +198,12 @@ def verify_solution_detailed(instance: LockInstance, solution: LockSolution) ->
 
     # Check negation links
     print("4. Checking negation link constraints...")
-    negation_failures = []
-    for dial_i, dial_j in instance.negations:
-        val_i = solution.dial_values[dial_i]
-        val_j = solution.dial_values[dial_j]
-        sum_val = val_i + val_j
-
-        if sum_val != 7:
-            negation_failures.append((dial_i, dial_j, val_i, val_j, sum_val))
-
     if negation_failures:
         print(f"   ✗ FAILED: {len(negation_failures)} violations")
-        for dial_i, dial_j, val_i, val_j, sum_val in negation_failures:
-            print(f"      Not({dial_i}, {dial_j}): {val_i} + {val_j} = {sum_val} (expected 7)")
+        _write_lines("      Not(%d, %d): %s + %s = %s (expected 7)"
+                     % (dial_i, dial_j, values[dial_i], values[dial_j],
+                        values[dial_i] + values[dial_j])
+                     for dial_i, dial_j in negation_failures)
         all_valid = False
     else:
         print(f"   ✓ PASSED: All {len(instance.negations)} negation links satisfied")
@@ -193,20 +211,12 @@ def verify_solution_detailed(instance: LockInstance, solution: LockSolution) ->
 
     # Check OR clauses
     print("5. Checking OR clause constraints...")
-    clause_failures = []
-    for dial_i, dial_j, dial_k in instance.clauses:
-        val_i = solution.dial_values[dial_i]
-        val_j = solution.dial_values[dial_j]
-        val_k = solution.dial_values[dial_k]
-        sum_val = val_i + val_j + val_k
-
-        if sum_val < 8:
-            clause_failures.append((dial_i, dial_j, dial_k, val_i, val_j, val_k, sum_val))
-
     if clause_failures:
         print(f"   ✗ FAILED: {len(clause_failures)} violations")
-        for dial_i, dial_j, dial_k, val_i, val_j, val_k, sum_val in clause_failures:
-            print(f"      OR({dial_i}, {dial_j}, {dial_k}): {val_i} + {val_j} + {val_k} = {sum_val} (expected >= 8)")
+        _write_lines("      OR(%d, %d, %d): %s + %s + %s = %s (expected >= 8)"
+                     % (dial_i, dial_j, dial_k, values[dial_i], values[dial_j], values[dial_k],
+                        values[dial_i] + values[dial_j] + values[dial_k])
+                     for dial_i, dial_j, dial_k in clause_failures)
         all_valid = False
     else:
         print(f"   ✓ PASSED: All {len(instance.clauses)} OR clauses satisfied")
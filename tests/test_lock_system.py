@@ -12,16 +12,24 @@ Tests cover:
 import pytest
 import sys
 import os
+import itertools
 import json
+import random
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import lock_types
 from lock_types import LockInstance, LockSolution
 from lock_verifier import verify_solution, verify_solution_detailed
-from lock_solver import solve_lock
+from lock_solver import (solve_lock, IncrementalLockSolver, SolutionCache, SAT_BACKENDS,
+                         BUILTIN_BACKEND, TINY_CNF_LIMIT, quick_unsat_check)
+from lock_generator import (instance_from_spec, auto_generate, auto_generate_batch,
+                            generate_hard_instance, generate_planted_instance,
+                            DIFFICULTY_PARAMS)
 
 
 # ============================================================================
@@ -54,6 +62,59 @@ class TestLockTypes:
         assert not is_valid
         assert "out of range" in error.lower()
 
+    def test_file_io_chunked_clauses(self, monkeypatch):
+        """Test that clauses written in several chunks give the usual JSON layout."""
+        import lock_types
+        monkeypatch.setattr(lock_types, "SAVE_CHUNK_CLAUSES", 2)
+        original = LockInstance(
+            num_dials=4,
+            binary_pins=[1, 2, 3, 4],
+            negations=[[1, 2]],
+            clauses=[[1, 2, 3], [2, 3, 4], [1, 3, 4], [1, 2, 4], [4, 3, 2]]
+        )
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            original.save_to_file(temp_path)
+            with open(temp_path) as f:
+                assert f.read() == json.dumps(original.to_json(), indent=2)
+        finally:
+            os.unlink(temp_path)
+
+    def test_solution_file_io(self):
+        """Test saving and loading a solution from file."""
+        original = LockSolution(dial_values={1: 6, 2: 1, 3: 6})
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            original.save_to_file(temp_path)
+            restored = LockSolution.load_from_file(temp_path)
+
+            assert restored.dial_values == original.dial_values
+        finally:
+            os.unlink(temp_path)
+
+    def test_range_binary_pins(self):
+        """Test that binary pins given as a range validate and serialize as a list."""
+        instance = LockInstance(
+            num_dials=4,
+            binary_pins=range(1, 5),
+            negations=[[1, 2]],
+            clauses=[[1, 3, 4]]
+        )
+        is_valid, error = instance.validate()
+        assert is_valid, f"Valid instance failed validation: {error}"
+        assert instance.to_json()["binary_pins"] == [1, 2, 3, 4]
+
+        instance.binary_pins = range(1, 6)  # Dial 5 doesn't exist
+        is_valid, error = instance.validate()
+        assert not is_valid
+        assert "Binary pin dial 5 is out of range" in error
+
     def test_invalid_dial_range_in_negations(self):
         """Test that out-of-range negation dials are caught."""
         instance = LockInstance(
@@ -168,122 +229,154 @@ class TestLockTypes:
         finally:
             os.unlink(temp_path)
 
+    def test_generated_instance_roundtrip_equality(self, tmp_path):
+        """Test that a generated instance (pins as a range) equals its reload."""
+        instance = generate_hard_instance(10, random.Random(0))
+        assert isinstance(instance.binary_pins, range)
+
+        path = str(tmp_path / "hard.json")
+        instance.save_to_file(path)
+        restored = LockInstance.load_from_file(path)
+
+        assert restored == instance
+        assert instance == restored
+        restored.binary_pins.pop()
+        assert restored != instance
+
+    def test_cached_load_returns_independent_copies(self, tmp_path, monkeypatch):
+        """Test that cached loads are independent, track file changes and stay bounded."""
+        monkeypatch.setattr(lock_types, "_LOAD_CACHE", OrderedDict())
+        monkeypatch.setattr(lock_types, "_load_cache_constraints", 0)
+        path = tmp_path / "instance.json"
+        LockInstance(num_dials=3, binary_pins=[1, 2, 3],
+                     clauses=[[1, 2, 3]]).save_to_file(str(path))
+
+        LockInstance.load_from_file(str(path))
+        assert not lock_types._LOAD_CACHE  # Only filled on request
+
+        first = LockInstance.load_from_file(str(path), cache=True)
+        first.clauses[0][0] = 3
+        second = LockInstance.load_from_file(str(path), cache=True)
+        assert second.clauses == [[1, 2, 3]]
+
+        # Same size, new contents: must be reparsed
+        LockInstance(num_dials=3, binary_pins=[1, 2, 3],
+                     clauses=[[3, 2, 1]]).save_to_file(str(path))
+        assert LockInstance.load_from_file(str(path), cache=True).clauses == [[3, 2, 1]]
+
+        # Older entries are dropped once the constraint budget is exceeded
+        monkeypatch.setattr(lock_types, "LOAD_CACHE_MAX_CONSTRAINTS", 4)
+        other = tmp_path / "other.json"
+        LockInstance(num_dials=3, binary_pins=[1, 2, 3],
+                     negations=[[1, 2]]).save_to_file(str(other))
+        LockInstance.load_from_file(str(other), cache=True)
+        assert len(lock_types._LOAD_CACHE) == 1
+        assert lock_types._load_cache_constraints == 4
+
+    def test_to_cnf(self):
+        """Test the CNF encoding of negations and OR clauses."""
+        instance = LockInstance(
+            num_dials=4,
+            binary_pins=[1, 2, 3, 4],
+            negations=[[1, 2]],
+            clauses=[[1, 3, 4]]
+        )
+
+        cnf = instance.to_cnf()
+
+        assert cnf == [[1, 2], [-1, -2], [1, 3, 4]]
+        # The encoding must not alias the instance's own clause lists
+        cnf[2].append(2)
+        assert instance.clauses == [[1, 3, 4]]
+        # ...unless the caller opts out of the copy
+        assert instance.to_cnf(copy=False)[2] is instance.clauses[0]
+
 
 # ============================================================================
 # Test Constraint Verification
 # ============================================================================
 
+@pytest.fixture(scope="class")
+def clause_instance():
+    """Three binary dials and the single clause (1, 2, 3)."""
+    return LockInstance(num_dials=3, binary_pins=[1, 2, 3], negations=[], clauses=[[1, 2, 3]])
+
+
+@pytest.fixture(scope="class")
+def pins_instance():
+    """Three binary dials and no other constraints."""
+    return LockInstance(num_dials=3, binary_pins=[1, 2, 3], negations=[], clauses=[])
+
+
+@pytest.fixture(scope="class")
+def negation_instance():
+    """Three binary dials with dials 1 and 2 linked by Not(1, 2)."""
+    return LockInstance(num_dials=3, binary_pins=[1, 2, 3], negations=[[1, 2]], clauses=[])
+
+
 class TestVerifier:
     """Test solution verification logic."""
 
-    def test_valid_solution(self):
+    def test_valid_solution(self, clause_instance):
         """Test that valid solutions pass verification."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[],
-            clauses=[[1, 2, 3]]
-        )
         solution = LockSolution(dial_values={1: 6, 2: 1, 3: 1})
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(clause_instance, solution)
         assert is_valid
         assert all("PASSED" in msg or "✓" in msg for msg in messages)
 
-    def test_missing_dial(self):
+    def test_missing_dial(self, pins_instance):
         """Test that missing dials are caught."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[],
-            clauses=[]
-        )
         solution = LockSolution(dial_values={1: 6, 2: 1})  # Missing dial 3
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(pins_instance, solution)
         assert not is_valid
         assert any("missing" in msg.lower() for msg in messages)
 
-    def test_extra_dial(self):
+    def test_extra_dial(self, pins_instance):
         """Test that extra dials are caught."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[],
-            clauses=[]
-        )
         solution = LockSolution(dial_values={1: 6, 2: 1, 3: 1, 4: 6})  # Extra dial 4
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(pins_instance, solution)
         assert not is_valid
         assert any("extra" in msg.lower() for msg in messages)
 
-    def test_invalid_binary_pin_value(self):
+    def test_invalid_binary_pin_value(self, pins_instance):
         """Test that non-binary values are caught."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[],
-            clauses=[]
-        )
         solution = LockSolution(dial_values={1: 3, 2: 1, 3: 6})  # Invalid value 3
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(pins_instance, solution)
         assert not is_valid
         assert any("binary pin" in msg.lower() for msg in messages)
 
-    def test_violated_negation(self):
+    def test_violated_negation(self, negation_instance):
         """Test that negation violations are caught."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[[1, 2]],
-            clauses=[]
-        )
         solution = LockSolution(dial_values={1: 6, 2: 6, 3: 1})  # Both 6, should sum to 7
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(negation_instance, solution)
         assert not is_valid
         assert any("not(" in msg.lower() or "negation" in msg.lower() for msg in messages)
 
-    def test_satisfied_negation(self):
+    def test_satisfied_negation(self, negation_instance):
         """Test that satisfied negations pass."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[[1, 2]],
-            clauses=[]
-        )
         solution = LockSolution(dial_values={1: 6, 2: 1, 3: 1})  # Sum = 7
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(negation_instance, solution)
         assert is_valid
 
-    def test_violated_clause(self):
+    def test_violated_clause(self, clause_instance):
         """Test that clause violations are caught."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[],
-            clauses=[[1, 2, 3]]
-        )
         solution = LockSolution(dial_values={1: 1, 2: 1, 3: 1})  # All FALSE, sum = 3
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(clause_instance, solution)
         assert not is_valid
         assert any("clause" in msg.lower() for msg in messages)
 
-    def test_satisfied_clause(self):
+    def test_satisfied_clause(self, clause_instance):
         """Test that satisfied clauses pass."""
-        instance = LockInstance(
-            num_dials=3,
-            binary_pins=[1, 2, 3],
-            negations=[],
-            clauses=[[1, 2, 3]]
-        )
         solution = LockSolution(dial_values={1: 6, 2: 1, 3: 1})  # One TRUE, sum = 8
 
-        is_valid, messages = verify_solution(instance, solution)
+        is_valid, messages = verify_solution(clause_instance, solution)
         assert is_valid
 
 
@@ -328,6 +421,43 @@ class TestSolver:
         assert solution is None
         assert stats['satisfiable'] is False
 
+    def test_quick_unsat_check(self):
+        """Test the negation-parity pre-check on odd and even cycles."""
+        odd = LockInstance(num_dials=3, binary_pins=[1, 2, 3],
+                           negations=[[1, 2], [2, 3], [1, 3]])
+        even = LockInstance(num_dials=4, binary_pins=[1, 2, 3, 4],
+                            negations=[[1, 2], [2, 3], [3, 4], [4, 1]],
+                            clauses=[[1, 2, 3]])
+
+        assert quick_unsat_check(odd)
+        assert not quick_unsat_check(even)
+        assert solve_lock(even)[0] is not None
+
+    def test_single_family_shortcuts(self):
+        """Test instances with only negations or only clauses against brute force."""
+        rng = random.Random(1)
+        for _ in range(100):
+            num_dials = rng.randint(2, 6)
+            dials = list(range(1, num_dials + 1))
+            if rng.random() < 0.5:
+                negations = [rng.sample(dials, 2) for _ in range(rng.randint(1, 5))]
+                clauses = []
+            else:
+                negations = []
+                clauses = [rng.sample(dials, 3) for _ in range(rng.randint(1, 5))] if num_dials >= 3 else []
+            instance = LockInstance(num_dials=num_dials, binary_pins=dials,
+                                    negations=negations, clauses=clauses)
+
+            expected = any(
+                LockSolution(dial_values=dict(zip(dials, values))).validate(instance)[0]
+                for values in itertools.product((1, 6), repeat=num_dials)
+            )
+            solution, stats = solve_lock(instance)
+            assert stats.satisfiable == expected == (solution is not None)
+            assert stats.num_clauses == len(negations) * 2 + len(clauses)
+            if solution is not None:
+                assert verify_solution(instance, solution)[0]
+
     def test_negation_constraint(self):
         """Test solver with negation constraints."""
         instance = LockInstance(
@@ -384,6 +514,185 @@ class TestSolver:
         assert stats['num_clauses'] == 3  # 2 from negation + 1 from clause
         assert stats['solve_time'] >= 0
 
+    def test_solver_stats_attributes(self):
+        """Test attribute and dict-style access to the solve statistics."""
+        instance = LockInstance(num_dials=3, binary_pins=[1, 2, 3], clauses=[[1, 2, 3]])
+        _, stats = solve_lock(instance)
+
+        assert stats.satisfiable is True
+        assert stats.num_clauses == stats['num_clauses'] == 1
+        assert 'cubes' not in stats
+        with pytest.raises(KeyError):
+            stats['cubes']
+        assert stats.to_dict()['num_variables'] == 3
+
+    def test_duplicate_clauses_removed(self):
+        """Test that repeated clauses and negations are solved once."""
+        instance = LockInstance(
+            num_dials=4,
+            binary_pins=[1, 2, 3, 4],
+            negations=[[1, 2], [2, 1]],
+            clauses=[[1, 3, 4], [4, 3, 1], [2, 3, 4]]
+        )
+
+        solution, stats = solve_lock(instance)
+        assert stats['duplicates_removed'] == 3
+        assert stats['num_clauses'] == 4
+        assert verify_solution(instance, solution)[0]
+
+        _, stats = solve_lock(instance, dedup=False)
+        assert stats['duplicates_removed'] == 0
+        assert stats['num_clauses'] == 7
+
+    def test_validated_skips_instance_check(self):
+        """Test that only unvalidated instances are checked before solving."""
+        instance = LockInstance(
+            num_dials=3,
+            binary_pins=[1, 2, 3],
+            negations=[],
+            clauses=[[1, 2, 3]]
+        )
+
+        solution, _ = solve_lock(instance, validated=True)
+        assert verify_solution(instance, solution)[0]
+
+        instance.clauses.append([1, 1, 2])
+        with pytest.raises(ValueError, match="Invalid lock instance"):
+            solve_lock(instance)
+
+    def test_reused_solver(self):
+        """Test that a reused solver answers each instance independently."""
+        sat_instance = LockInstance(
+            num_dials=3,
+            binary_pins=[1, 2, 3],
+            negations=[[1, 2]],
+            clauses=[[1, 2, 3]]
+        )
+        unsat_instance = LockInstance(
+            num_dials=3,
+            binary_pins=[1, 2, 3],
+            negations=[[1, 2], [2, 3], [1, 3]],
+            clauses=[]
+        )
+        larger_instance = LockInstance(
+            num_dials=6,
+            binary_pins=[1, 2, 3, 4, 5, 6],
+            negations=[[4, 5]],
+            clauses=[[4, 5, 6], [1, 5, 6]]
+        )
+
+        solver = IncrementalLockSolver()
+        try:
+            for instance in [unsat_instance, sat_instance, larger_instance, unsat_instance, sat_instance]:
+                expected, _ = solve_lock(instance)
+                solution, stats = solve_lock(instance, solver=solver)
+                assert (solution is None) == (expected is None)
+                if solution is not None:
+                    is_valid, messages = verify_solution(instance, solution)
+                    assert is_valid
+        finally:
+            solver.delete()
+
+    def test_solution_cache(self, tmp_path):
+        """Test that a SolutionCache answers repeated instances from disk."""
+        sat_instance = LockInstance(
+            num_dials=4,
+            binary_pins=[1, 2, 3, 4],
+            negations=[[1, 2], [3, 4]],
+            clauses=[[1, 3, 4], [2, 3, 4]]
+        )
+        unsat_instance = LockInstance(
+            num_dials=3,
+            binary_pins=[1, 2, 3],
+            negations=[[1, 2], [2, 3], [1, 3]],
+            clauses=[]
+        )
+        path = str(tmp_path / "solutions.sqlite")
+
+        cache = SolutionCache(path)
+        try:
+            for instance in [sat_instance, unsat_instance]:
+                _, stats = solve_lock(instance, cache=cache)
+                assert not stats.cache_hit
+        finally:
+            cache.close()
+
+        # Reordered constraints map to the same entry, in a new connection
+        reordered = LockInstance(
+            num_dials=4,
+            binary_pins=[1, 2, 3, 4],
+            negations=[[4, 3], [2, 1]],
+            clauses=[[4, 3, 2], [1, 3, 4]]
+        )
+        cache = SolutionCache(path)
+        try:
+            solution, stats = solve_lock(reordered, cache=cache)
+            assert stats.cache_hit and stats.satisfiable
+            is_valid, messages = verify_solution(reordered, solution)
+            assert is_valid
+
+            solution, stats = solve_lock(unsat_instance, cache=cache)
+            assert stats.cache_hit and solution is None
+        finally:
+            cache.close()
+
+    @pytest.mark.parametrize("backend", sorted(SAT_BACKENDS) + [BUILTIN_BACKEND])
+    def test_backends(self, backend):
+        """Test that every SAT backend finds a valid solution."""
+        instance = LockInstance(
+            num_dials=4,
+            binary_pins=[1, 2, 3, 4],
+            negations=[[1, 2], [3, 4]],
+            clauses=[[1, 3, 4], [2, 3, 4]]
+        )
+
+        solution, stats = solve_lock(instance, backend=backend)
+
+        assert solution is not None
+        is_valid, messages = verify_solution(instance, solution)
+        assert is_valid
+
+    def test_tiny_instances_match_sat_solver(self):
+        """Test that the built-in search for tiny CNFs agrees with the SAT solver."""
+        rng = random.Random(0)
+        for _ in range(200):
+            num_dials = rng.randint(3, 6)
+            dials = list(range(1, num_dials + 1))
+            instance = LockInstance(
+                num_dials=num_dials,
+                binary_pins=dials,
+                negations=[rng.sample(dials, 2) for _ in range(rng.randint(0, 4))],
+                clauses=[rng.sample(dials, 3) for _ in range(rng.randint(0, 6))]
+            )
+            assert len(instance.to_cnf()) <= TINY_CNF_LIMIT
+
+            expected, _ = solve_lock(instance, backend='glucose3')
+            solution, stats = solve_lock(instance)
+            assert (solution is None) == (expected is None)
+            assert stats['satisfiable'] == (solution is not None)
+            if solution is not None:
+                is_valid, messages = verify_solution(instance, solution)
+                assert is_valid
+
+    def test_builtin_backend_matches_sat_solver(self):
+        """Test that forcing the built-in search on larger CNFs agrees with pysat."""
+        for seed in range(10):
+            instance = generate_hard_instance(30, random.Random(seed))
+            assert len(instance.to_cnf()) > TINY_CNF_LIMIT
+
+            expected, _ = solve_lock(instance, backend='glucose3')
+            solution, _ = solve_lock(instance, backend=BUILTIN_BACKEND)
+            assert (solution is None) == (expected is None)
+            if solution is not None:
+                assert verify_solution(instance, solution)[0]
+
+    def test_unknown_backend(self):
+        """Test that an unknown SAT backend is rejected."""
+        instance = LockInstance(num_dials=1, binary_pins=[1])
+
+        with pytest.raises(ValueError):
+            solve_lock(instance, backend='no-such-solver')
+
 
 # ============================================================================
 # Test Example Instances
@@ -600,6 +909,32 @@ class TestEdgeCases:
 
         assert restored.dial_values == original.dial_values
 
+    def test_solution_file_formats(self, tmp_path):
+        """Test the compact solution format and reading the keyed one."""
+        complete = LockSolution(dial_values={2: 1, 1: 6, 3: 6})
+        assert complete.to_json() == {"version": 2, "dial_values": [6, 1, 6]}
+
+        path = tmp_path / "solution.json"
+        complete.save_to_file(str(path))
+        assert json.loads(path.read_text()) == complete.to_json()
+        assert LockSolution.load_from_file(str(path)).dial_values == {1: 6, 2: 1, 3: 6}
+
+        # Dials other than exactly 1..N keep the keyed form
+        partial = LockSolution(dial_values={1: 6, 3: 1})
+        assert partial.to_json() == {"dial_values": {"1": 6, "3": 1}}
+        assert LockSolution.from_json(partial.to_json()).dial_values == {1: 6, 3: 1}
+
+        with pytest.raises(ValueError, match="version"):
+            LockSolution.from_json({"version": 3, "dial_values": []})
+
+    def test_solution_as_array(self):
+        """Test the dense, dial-indexed view of a solution."""
+        solution = LockSolution(dial_values={1: 6, 3: 1, 7: 6})
+
+        assert solution.as_array(3) == [None, 6, None, 1]
+        solution.dial_values[2] = 1
+        assert solution.as_array(3) == [None, 6, 1, 1]
+
     def test_malformed_json_handling(self):
         """Test that malformed JSON is handled gracefully."""
         with pytest.raises(ValueError):
@@ -619,5 +954,78 @@ class TestEdgeCases:
         assert "out of range" in error.lower()
 
 
+# ============================================================================
+# Test Instance Generation
+# ============================================================================
+
+class TestGenerator:
+    """Test batch and random instance generation."""
+
+    def test_instance_from_spec(self):
+        """Test building an instance from a JSON spec."""
+        instance = instance_from_spec({
+            "num_dials": 4,
+            "negations": [[1, 2]],
+            "clauses": [[1, 3, 4]]
+        })
+
+        assert instance.num_dials == 4
+        assert instance.binary_pins == [1, 2, 3, 4]
+        assert instance.negations == [[1, 2]]
+        assert instance.clauses == [[1, 3, 4]]
+
+    def test_instance_from_spec_num_dials_override(self):
+        """Test that an explicit dial count replaces the spec's."""
+        instance = instance_from_spec({"clauses": [[1, 2, 3]]}, num_dials=5)
+        assert instance.num_dials == 5
+        assert instance.binary_pins == [1, 2, 3, 4, 5]
+
+    def test_instance_from_spec_invalid(self):
+        """Test that incomplete or invalid specs are rejected."""
+        with pytest.raises(ValueError):
+            instance_from_spec({"clauses": [[1, 2, 3]]})
+        with pytest.raises(ValueError):
+            instance_from_spec({"num_dials": 2, "clauses": [[1, 2, 3]]})
+
+    def test_auto_generate_seed_is_reproducible(self, tmp_path, capsys, monkeypatch):
+        """Test that the same seed regenerates the same instance."""
+        monkeypatch.chdir(tmp_path)  # Nothing may land in the caller's directory
+        first, _ = auto_generate(12, 'medium', str(tmp_path / "a"), seed=7)
+        second, _ = auto_generate(12, 'medium', str(tmp_path / "b"), seed=7)
+
+        assert Path(first).read_text() == Path(second).read_text()
+
+    @pytest.mark.parametrize("difficulty", sorted(DIFFICULTY_PARAMS))
+    def test_planted_instance(self, difficulty):
+        """Test that the planted solution satisfies the generated instance."""
+        rng = random.Random(3)
+        for num_vars in (3, 10, 60):
+            instance, solution = generate_planted_instance(num_vars, difficulty, rng)
+            assert instance.validate()[0]
+            is_valid, error = solution.validate(instance)
+            assert is_valid, error
+
+    def test_auto_generate_quiet(self, tmp_path, capsys, monkeypatch):
+        """Test that quiet mode reports only the saved file paths."""
+        monkeypatch.chdir(tmp_path)  # Nothing may land in the caller's directory
+        instance_file, solution_file = auto_generate(8, 'trivial', str(tmp_path / "q"),
+                                                     seed=1, quiet=True)
+
+        assert capsys.readouterr().out.splitlines() == [instance_file, solution_file]
+        assert not (tmp_path / "examples").exists()
+
+    def test_auto_generate_batch(self, tmp_path, capsys, monkeypatch):
+        """Test that a parallel batch matches the same seeds run one by one."""
+        monkeypatch.chdir(tmp_path)  # Nothing may land in the caller's directory
+        files = auto_generate_batch(10, 'easy', 3, str(tmp_path / "b"), seed=5, processes=2)
+
+        assert [f for f, _ in files] == [str(tmp_path / f"b_{k:03d}_instance.json")
+                                         for k in range(3)]
+        for k, (instance_file, solution_file) in enumerate(files):
+            single, _ = auto_generate(10, 'easy', str(tmp_path / f"s{k}"), seed=5 + k)
+            assert Path(instance_file).read_text() == Path(single).read_text()
+            assert Path(solution_file).exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
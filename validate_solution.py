@@ -4,76 +4,123 @@ Standalone validation tool for lock instances and solutions.
 
 Usage:
     python validate_solution.py <instance.json> <solution.json>
+    python validate_solution.py --stdin
 
 Example:
     python validate_solution.py examples/instances/small.json examples/solutions/small.json
+
+With --stdin, pairs of paths ("<instance.json> <solution.json>", one pair
+per line) are read from standard input and each is answered with one
+result line, so a single process checks many candidate solutions; an
+instance shared by several pairs is only parsed once.
 """
 
 import sys
-import json
 from pathlib import Path
 from src.lock_types import LockInstance, LockSolution
 
 
+def _exit(lines, code):
+    """Write the report lines in one call instead of a print() per line, then exit."""
+    sys.stdout.write("".join(line + "\n" for line in lines))
+    sys.exit(code)
+
+
+def _check_pair(instance_file, solution_file):
+    """Validate one pair of files and return (is_valid, one-line result)."""
+    label = f"{instance_file} {solution_file}"
+    try:
+        # Pairs often share an instance: the load cache parses it once
+        instance = LockInstance.load_from_file(instance_file, cache=True)
+        solution = LockSolution.load_from_file(solution_file)
+    except FileNotFoundError as e:
+        return False, f"❌ {label}: file not found: {e.filename}"
+    except Exception as e:
+        return False, f"❌ {label}: error loading: {e}"
+
+    is_valid, error_msg = solution.validate(instance)
+    if is_valid:
+        return True, f"✅ {label}: VALID"
+    return False, f"❌ {label}: INVALID - {error_msg}"
+
+
+def stdin_mode():
+    """Validate the path pairs read from stdin; exit 0 only if all are valid."""
+    all_valid = True
+    for line in sys.stdin:
+        paths = line.split()
+        if not paths:
+            continue
+        if len(paths) != 2:
+            is_valid, result = False, f"❌ Expected <instance.json> <solution.json>, got: {line.strip()}"
+        else:
+            is_valid, result = _check_pair(*paths)
+        all_valid = all_valid and is_valid
+        # One line per pair, flushed so a caller can read it right away
+        print(result, flush=True)
+    sys.exit(0 if all_valid else 1)
+
+
 def main():
+    if sys.argv[1:] == ["--stdin"]:
+        stdin_mode()
+
+    out = []
     if len(sys.argv) != 3:
-        print("Usage: python validate_solution.py <instance.json> <solution.json>")
-        print()
-        print("Example:")
-        print("  python validate_solution.py examples/instances/small.json examples/solutions/small.json")
-        sys.exit(1)
+        out.append("Usage: python validate_solution.py <instance.json> <solution.json>")
+        out.append("       python validate_solution.py --stdin")
+        out.append("")
+        out.append("Example:")
+        out.append("  python validate_solution.py examples/instances/small.json examples/solutions/small.json")
+        _exit(out, 1)
 
     instance_file = sys.argv[1]
     solution_file = sys.argv[2]
 
     # Load instance
     try:
-        with open(instance_file) as f:
-            instance_data = json.load(f)
-        instance = LockInstance.from_json(instance_data)
-        print(f"✓ Loaded instance: {instance.num_dials} dials, {len(instance.clauses)} clauses, {len(instance.negations)} negations")
+        instance = LockInstance.load_from_file(instance_file)
+        out.append(f"✓ Loaded instance: {instance.num_dials} dials, {len(instance.clauses)} clauses, {len(instance.negations)} negations")
     except FileNotFoundError:
-        print(f"❌ Error: Instance file not found: {instance_file}")
-        sys.exit(1)
+        out.append(f"❌ Error: Instance file not found: {instance_file}")
+        _exit(out, 1)
     except Exception as e:
-        print(f"❌ Error loading instance: {e}")
-        sys.exit(1)
+        out.append(f"❌ Error loading instance: {e}")
+        _exit(out, 1)
 
     # Load solution
     try:
-        with open(solution_file) as f:
-            solution_data = json.load(f)
-        solution = LockSolution.from_json(solution_data)
-        print(f"✓ Loaded solution: {len(solution.dial_values)} dials set")
+        solution = LockSolution.load_from_file(solution_file)
+        out.append(f"✓ Loaded solution: {len(solution.dial_values)} dials set")
     except FileNotFoundError:
-        print(f"❌ Error: Solution file not found: {solution_file}")
-        sys.exit(1)
+        out.append(f"❌ Error: Solution file not found: {solution_file}")
+        _exit(out, 1)
     except Exception as e:
-        print(f"❌ Error loading solution: {e}")
-        sys.exit(1)
+        out.append(f"❌ Error loading solution: {e}")
+        _exit(out, 1)
 
     # Validate
-    print("\n" + "="*60)
-    print("VALIDATING SOLUTION")
-    print("="*60)
+    out.append("\n" + "="*60)
+    out.append("VALIDATING SOLUTION")
+    out.append("="*60)
 
     is_valid, error_msg = solution.validate(instance)
 
     if is_valid:
-        print("\n✅ SOLUTION IS VALID - All constraints satisfied!")
-        print("\nDetails:")
-        print(f"  ✓ All {instance.num_dials} dials are set")
-        print(f"  ✓ All {len(instance.binary_pins)} binary pin constraints satisfied")
-        print(f"  ✓ All {len(instance.negations)} negation constraints satisfied")
-        print(f"  ✓ All {len(instance.clauses)} OR clause constraints satisfied")
-        sys.exit(0)
+        out.append("\n✅ SOLUTION IS VALID - All constraints satisfied!")
+        out.append("\nDetails:")
+        out.append(f"  ✓ All {instance.num_dials} dials are set")
+        out.append(f"  ✓ All {len(instance.binary_pins)} binary pin constraints satisfied")
+        out.append(f"  ✓ All {len(instance.negations)} negation constraints satisfied")
+        out.append(f"  ✓ All {len(instance.clauses)} OR clause constraints satisfied")
+        _exit(out, 0)
     else:
-        print("\n❌ SOLUTION IS INVALID")
-        print(f"\nValidation error:")
-        print(f"  {error_msg}")
-        print()
-        print("The solution violates the constraints of the instance.")
-        sys.exit(1)
+        out.append("\n❌ SOLUTION IS INVALID")
+        out.append(f"\nValidation error:")
+        out.append(f"  {error_msg}")
+        out.append("")
+        out.append("The solution violates the constraints of the instance.")
+        _exit(out, 1)
 
 
 if __name__ == "__main__":